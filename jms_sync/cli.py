@@ -121,7 +121,10 @@ def main():
         
         # 运行同步管理器
         start_time = time.time()
-        result = sync_manager.run_with_retry(max_retries=args.retries, retry_interval=args.interval)
+        try:
+            result = sync_manager.run_with_retry(max_retries=args.retries, retry_interval=args.interval)
+        finally:
+            sync_manager.js_client.close()
         end_time = time.time()
         
         # 计算运行时间
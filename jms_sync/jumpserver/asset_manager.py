@@ -11,10 +11,13 @@ JumpServer资产管理模块 - 负责JumpServer资产的创建、更新、删除
 - 查询节点下资产
 """
 
+import dataclasses
 import logging
 import json
 import time
-from typing import Dict, List, Any, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import Dict, List, Any, Optional, Union, Callable, Tuple
 from datetime import datetime
 
 from jms_sync.utils.exceptions import JumpServerError, JumpServerAPIError
@@ -22,6 +25,28 @@ from jms_sync.utils.decorators import retry, log_execution_time
 from jms_sync.utils.logger import get_logger
 from jms_sync.jumpserver.models import AssetInfo
 
+# 同步生成的资产备注前缀
+SYNC_COMMENT_PREFIX = "由JMS-Sync同步于"
+
+
+# 各平台资产创建请求的公共字段，构建请求时复制后再填充资产相关字段
+_LINUX_ASSET_TEMPLATE: Dict[str, Any] = {
+    "platform": {"pk": 1},  # 1表示Linux平台
+    "labels": [],
+    "is_active": True,
+}
+_WINDOWS_ASSET_TEMPLATE: Dict[str, Any] = {
+    "platform": {"pk": 5},  # 5表示Windows平台
+    "labels": [],
+    "is_active": True,
+}
+
+
+def _default_comment() -> str:
+    """生成默认的资产备注"""
+    return f"{SYNC_COMMENT_PREFIX} {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+
+
 class AssetManager:
     """
     JumpServer资产管理类，负责资产的创建、更新、删除和查询
@@ -53,6 +78,16 @@ class AssetManager:
         """
         self.client = js_client
         self.logger = get_logger(__name__)
+    
+    @cached_property
+    def _ssh_port(self) -> int:
+        """配置中的默认SSH端口，首次访问后缓存"""
+        return getattr(self.client, 'config', {}).get('protocols', {}).get('ssh_port', 22)
+    
+    @cached_property
+    def _rdp_port(self) -> int:
+        """配置中的默认RDP端口，首次访问后缓存"""
+        return getattr(self.client, 'config', {}).get('protocols', {}).get('rdp_port', 3389)
         
     def get_assets_by_node_id(self, node_id: str) -> List[AssetInfo]:
         """
@@ -67,32 +102,48 @@ class AssetManager:
         Raises:
             JumpServerAPIError: API请求失败时抛出异常
         """
-        self.logger.info(f"获取节点({node_id})下的资产")
+        self.logger.info("获取节点(%s)下的资产", node_id)
         try:
             # 构建API请求
             endpoint = f"/api/v1/assets/hosts/?node_id={node_id}"
             
-            # 发送请求
-            response = self.client._api_request("GET", endpoint)
+            # 发送条件请求，节点资产未变化时服务端返回304，复用上次的响应数据
+            response = self.client._api_request("GET", endpoint, conditional=True)
             
             # 解析响应
             if isinstance(response, list):
-                assets = []
-                for asset_data in response:
-                    asset = self._parse_asset_data(asset_data)
-                    assets.append(asset)
-                return assets
+                return self._parse_assets(response)
             else:
-                self.logger.error(f"获取节点({node_id})资产返回格式错误: {response}")
+                self.logger.error("获取节点(%s)资产返回格式错误: %s", node_id, response)
                 return []
                 
         except JumpServerAPIError as e:
-            self.logger.error(f"获取节点({node_id})资产失败: {str(e)}")
+            self.logger.error("获取节点(%s)资产失败: %s", node_id, e)
             raise
         except Exception as e:
-            self.logger.error(f"获取节点({node_id})资产失败: {str(e)}")
+            self.logger.error("获取节点(%s)资产失败: %s", node_id, e)
             raise JumpServerAPIError(f"获取节点资产失败: {str(e)}")
     
+    def get_assets_by_node_ids(self, node_ids: List[str]) -> Dict[str, List[AssetInfo]]:
+        """
+        并发获取多个节点下的资产，总耗时取决于最慢的一个请求
+        
+        Args:
+            node_ids: 节点ID列表
+            
+        Returns:
+            Dict[str, List[AssetInfo]]: 节点ID到资产列表的映射
+            
+        Raises:
+            JumpServerAPIError: 任一节点的资产获取失败时抛出异常
+        """
+        node_ids = list(dict.fromkeys(node_ids))
+        results = self._run_concurrently(self.get_assets_by_node_id, node_ids)
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+        return dict(zip(node_ids, results))
+    
     def _parse_asset_data(self, asset_data: Dict[str, Any]) -> AssetInfo:
         """
         解析资产数据
@@ -103,40 +154,61 @@ class AssetManager:
         Returns:
             AssetInfo: 资产信息对象
         """
-        asset = AssetInfo()
-        
-        # 获取基本信息
-        asset.id = asset_data.get('id', '')
-        asset.name = asset_data.get('name', '')
-        asset.address = asset_data.get('address', '')
+        get = asset_data.get
         
         # 获取平台信息
-        platform = asset_data.get('platform', {})
-        asset.platform = platform.get('name', '') if isinstance(platform, dict) else str(platform)
+        platform = get('platform', {})
+        platform_name = platform.get('name', '') if isinstance(platform, dict) else str(platform)
         
         # 获取节点信息
-        nodes = asset_data.get('nodes', [])
-        if nodes and isinstance(nodes, list) and len(nodes) > 0:
+        node_id = None
+        nodes = get('nodes')
+        if nodes and isinstance(nodes, list):
             node = nodes[0]
-            asset.node_id = node.get('id', '') if isinstance(node, dict) else ''
+            node_id = node.get('id', '') if isinstance(node, dict) else ''
+        
+        # 获取网域信息，设置了网域时接口返回对象，统一为网域ID
+        domain = get('domain')
+        if isinstance(domain, dict):
+            domain = domain.get('id') or domain.get('pk')
         
         # 获取协议信息
-        protocols = asset_data.get('protocols', [])
-        if protocols and isinstance(protocols, list) and len(protocols) > 0:
-            protocol = protocols[0]
-            if isinstance(protocol, dict):
-                asset.protocol = protocol.get('name', '')
-                asset.port = protocol.get('port', 0)
-        
-        # 获取其他信息
-        asset.comment = asset_data.get('comment', '')
-        asset.domain_id = asset_data.get('domain', '')
-        asset.is_active = asset_data.get('is_active', True)
-        
-        return asset
+        protocol_name, port = 'ssh', 22
+        protocols = get('protocols')
+        if protocols and isinstance(protocols, list) and isinstance(protocols[0], dict):
+            protocol_name = protocols[0].get('name', '')
+            port = protocols[0].get('port', 0)
+        
+        # 一次构造完成，避免先创建空对象再逐个赋值
+        return AssetInfo(
+            id=get('id', ''),
+            name=get('name', ''),
+            address=get('address', ''),
+            platform=platform_name,
+            protocol=protocol_name,
+            port=port,
+            is_active=get('is_active', True),
+            domain_id=domain or '',
+            node_id=node_id,
+            comment=get('comment', '')
+        )
+    
+    def _parse_assets(self, items: List[Dict[str, Any]]) -> List[AssetInfo]:
+        """
+        批量解析资产数据
+        
+        Args:
+            items: API返回的资产数据列表
+            
+        Returns:
+            List[AssetInfo]: 资产信息对象列表
+        """
+        parse = self._parse_asset_data
+        return [parse(item) for item in items]
     
     def create_linux_asset(self, name: str, address: str, node_id: str, domain_id: Optional[str] = None, 
-                          comment: Optional[str] = None, port: int = 22) -> AssetInfo:
+                          comment: Optional[str] = None, port: Optional[int] = None,
+                          accounts: Optional[List[Dict[str, Any]]] = None) -> AssetInfo:
         """
         创建Linux资产
         
@@ -146,7 +218,8 @@ class AssetManager:
             node_id: 节点ID
             domain_id: 网域ID，可选
             comment: 备注信息，可选
-            port: SSH端口，默认22
+            port: SSH端口，默认使用配置中的ssh_port（未配置时为22）
+            accounts: 随资产一起创建的账号列表，可选
             
         Returns:
             AssetInfo: 创建的资产信息
@@ -154,45 +227,44 @@ class AssetManager:
         Raises:
             JumpServerAPIError: API请求失败时抛出异常
         """
-        self.logger.info(f"创建Linux资产: {name} ({address})")
+        self.logger.info("创建Linux资产: %s (%s)", name, address)
         
-        # 构建请求数据
-        asset_data = {
-            "platform": {"pk": 1},  # 1表示Linux平台
-            "nodes": [{"pk": node_id}],
-            "protocols": [{"name": "ssh", "port": port}],
-            "labels": [],
-            "is_active": True,
-            "name": name,
-            "address": address,
-            "comment": comment or f"由JMS-Sync同步于 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-        }
+        # 基于平台模板构建请求数据
+        asset_data = _LINUX_ASSET_TEMPLATE.copy()
+        asset_data["nodes"] = [{"pk": node_id}]
+        asset_data["protocols"] = [{"name": "ssh", "port": port or self._ssh_port}]
+        asset_data["name"] = name
+        asset_data["address"] = address
+        asset_data["comment"] = comment or _default_comment()
         
         # 如果指定了网域，添加到请求数据
         if domain_id:
             asset_data["domain"] = domain_id
         
-        # 添加账号列表，初始为空
-        asset_data["accounts"] = []
+        # 随资产一并提交账号，避免创建后再单独关联账号
+        if accounts:
+            asset_data["accounts"] = accounts
         
         try:
             # 发送API请求
             endpoint = "/api/v1/assets/hosts/?platform=1"
             response = self.client._api_request("POST", endpoint, json_data=asset_data)
+            self.client._invalidate_asset_index()
             
             # 解析响应
             asset = self._parse_asset_data(response)
-            self.logger.info(f"Linux资产创建成功: {asset.name} (ID: {asset.id})")
+            self.logger.info("Linux资产创建成功: %s (ID: %s)", asset.name, asset.id)
             return asset
         except JumpServerAPIError as e:
-            self.logger.error(f"创建Linux资产失败: {str(e)}")
+            self.logger.error("创建Linux资产失败: %s", e)
             raise
         except Exception as e:
-            self.logger.error(f"创建Linux资产失败: {str(e)}")
+            self.logger.error("创建Linux资产失败: %s", e)
             raise JumpServerAPIError(f"创建Linux资产失败: {str(e)}")
     
     def create_windows_asset(self, name: str, address: str, node_id: str, domain_id: Optional[str] = None,
-                            comment: Optional[str] = None, port: int = 3389) -> AssetInfo:
+                            comment: Optional[str] = None, port: Optional[int] = None,
+                            accounts: Optional[List[Dict[str, Any]]] = None) -> AssetInfo:
         """
         创建Windows资产
         
@@ -202,7 +274,8 @@ class AssetManager:
             node_id: 节点ID
             domain_id: 网域ID，可选
             comment: 备注信息，可选
-            port: RDP端口，默认3389
+            port: RDP端口，默认使用配置中的rdp_port（未配置时为3389）
+            accounts: 随资产一起创建的账号列表，可选
             
         Returns:
             AssetInfo: 创建的资产信息
@@ -210,41 +283,39 @@ class AssetManager:
         Raises:
             JumpServerAPIError: API请求失败时抛出异常
         """
-        self.logger.info(f"创建Windows资产: {name} ({address})")
+        self.logger.info("创建Windows资产: %s (%s)", name, address)
         
-        # 构建请求数据
-        asset_data = {
-            "platform": {"pk": 5},  # 5表示Windows平台
-            "nodes": [{"pk": node_id}],
-            "protocols": [{"name": "rdp", "port": port}],
-            "labels": [],
-            "is_active": True,
-            "name": name,
-            "address": address,
-            "comment": comment or f"由JMS-Sync同步于 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-        }
+        # 基于平台模板构建请求数据
+        asset_data = _WINDOWS_ASSET_TEMPLATE.copy()
+        asset_data["nodes"] = [{"pk": node_id}]
+        asset_data["protocols"] = [{"name": "rdp", "port": port or self._rdp_port}]
+        asset_data["name"] = name
+        asset_data["address"] = address
+        asset_data["comment"] = comment or _default_comment()
         
         # 如果指定了网域，添加到请求数据
         if domain_id:
             asset_data["domain"] = domain_id
         
-        # 添加账号列表，初始为空
-        asset_data["accounts"] = []
+        # 随资产一并提交账号，避免创建后再单独关联账号
+        if accounts:
+            asset_data["accounts"] = accounts
         
         try:
             # 发送API请求
             endpoint = "/api/v1/assets/hosts/?platform=5"
             response = self.client._api_request("POST", endpoint, json_data=asset_data)
+            self.client._invalidate_asset_index()
             
             # 解析响应
             asset = self._parse_asset_data(response)
-            self.logger.info(f"Windows资产创建成功: {asset.name} (ID: {asset.id})")
+            self.logger.info("Windows资产创建成功: %s (ID: %s)", asset.name, asset.id)
             return asset
         except JumpServerAPIError as e:
-            self.logger.error(f"创建Windows资产失败: {str(e)}")
+            self.logger.error("创建Windows资产失败: %s", e)
             raise
         except Exception as e:
-            self.logger.error(f"创建Windows资产失败: {str(e)}")
+            self.logger.error("创建Windows资产失败: %s", e)
             raise JumpServerAPIError(f"创建Windows资产失败: {str(e)}")
     
     def update_asset(self, asset_id: str, name: str, address: str, platform_id: int, node_id: str,
@@ -271,7 +342,7 @@ class AssetManager:
         Raises:
             JumpServerAPIError: API请求失败时抛出异常
         """
-        self.logger.info(f"更新资产: {name} (ID: {asset_id})")
+        self.logger.info("更新资产: %s (ID: %s)", name, asset_id)
         
         # 构建请求数据
         asset_data = {
@@ -283,7 +354,7 @@ class AssetManager:
             "directory_services": [],
             "labels": [],
             "is_active": is_active,
-            "comment": comment or f"由JMS-Sync同步于 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+            "comment": comment or _default_comment()
         }
         
         # 如果指定了网域，添加到请求数据
@@ -296,18 +367,43 @@ class AssetManager:
             # 发送API请求
             endpoint = f"/api/v1/assets/hosts/{asset_id}/"
             response = self.client._api_request("PUT", endpoint, json_data=asset_data)
+            self.client._invalidate_asset_index()
             
             # 解析响应
             asset = self._parse_asset_data(response)
-            self.logger.info(f"资产更新成功: {asset.name} (ID: {asset.id})")
+            self.logger.info("资产更新成功: %s (ID: %s)", asset.name, asset.id)
             return asset
         except JumpServerAPIError as e:
-            self.logger.error(f"更新资产失败: {str(e)}")
+            self.logger.error("更新资产失败: %s", e)
             raise
         except Exception as e:
-            self.logger.error(f"更新资产失败: {str(e)}")
+            self.logger.error("更新资产失败: %s", e)
             raise JumpServerAPIError(f"更新资产失败: {str(e)}")
     
+    def _update_from_info(self, asset_info: AssetInfo) -> AssetInfo:
+        """
+        根据资产信息对象更新资产
+        
+        Args:
+            asset_info: 资产信息对象，必须包含id
+            
+        Returns:
+            AssetInfo: 更新后的资产信息
+        """
+        platform_id = 5 if asset_info.platform.lower() == 'windows' else 1
+        return self.update_asset(
+            asset_id=asset_info.id,
+            name=asset_info.name,
+            address=asset_info.address,
+            platform_id=platform_id,
+            node_id=asset_info.node_id,
+            domain_id=asset_info.domain_id,
+            protocol=asset_info.protocol,
+            port=asset_info.port,
+            comment=asset_info.comment,
+            is_active=asset_info.is_active
+        )
+    
     def delete_asset(self, asset_id: str) -> bool:
         """
         删除资产
@@ -321,20 +417,21 @@ class AssetManager:
         Raises:
             JumpServerAPIError: API请求失败时抛出异常
         """
-        self.logger.info(f"删除资产: ID={asset_id}")
+        self.logger.info("删除资产: ID=%s", asset_id)
         
         try:
             # 发送API请求
             endpoint = f"/api/v1/assets/hosts/{asset_id}/"
             self.client._api_request("DELETE", endpoint)
+            self.client._invalidate_asset_index()
             
-            self.logger.info(f"资产删除成功: ID={asset_id}")
+            self.logger.info("资产删除成功: ID=%s", asset_id)
             return True
         except JumpServerAPIError as e:
-            self.logger.error(f"删除资产失败: {str(e)}")
+            self.logger.error("删除资产失败: %s", e)
             raise
         except Exception as e:
-            self.logger.error(f"删除资产失败: {str(e)}")
+            self.logger.error("删除资产失败: %s", e)
             raise JumpServerAPIError(f"删除资产失败: {str(e)}")
     
     def create_asset(self, asset_info: AssetInfo) -> AssetInfo:
@@ -358,7 +455,8 @@ class AssetManager:
                 node_id=asset_info.node_id,
                 domain_id=asset_info.domain_id,
                 comment=asset_info.comment,
-                port=asset_info.port or 3389
+                port=asset_info.port or self._rdp_port,
+                accounts=asset_info.accounts
             )
         else:
             # 默认为Linux
@@ -368,5 +466,108 @@ class AssetManager:
                 node_id=asset_info.node_id,
                 domain_id=asset_info.domain_id,
                 comment=asset_info.comment,
-                port=asset_info.port or 22
-            ) 
\ No newline at end of file
+                port=asset_info.port or self._ssh_port,
+                accounts=asset_info.accounts
+            )
+
+    def create_asset_with_accounts(self, asset_info: AssetInfo, accounts: List[Dict[str, Any]]) -> AssetInfo:
+        """
+        创建资产并在同一请求中关联账号
+        
+        Args:
+            asset_info: 资产信息对象
+            accounts: 账号列表，格式与JumpServer资产接口的accounts字段一致
+            
+        Returns:
+            AssetInfo: 创建的资产信息
+            
+        Raises:
+            JumpServerAPIError: API请求失败时抛出异常
+        """
+        return self.create_asset(dataclasses.replace(asset_info, accounts=list(accounts)))
+    
+    def _run_concurrently(self, func: Callable[[Any], Any], items: List[Any]) -> List[Any]:
+        """
+        使用有界线程池并发执行资产操作
+        
+        Args:
+            func: 对单个元素执行的操作
+            items: 待处理元素列表
+            
+        Returns:
+            List[Any]: 与items顺序一致的结果列表，失败的元素对应位置为异常对象
+        """
+        if not items:
+            return []
+        
+        workers = min(getattr(self.client, 'max_workers', 8), len(items))
+        results = []
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(func, item) for item in items]
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    results.append(e)
+        return results
+    
+    def bulk_create_assets(self, assets: List[AssetInfo]) -> List[Union[AssetInfo, Exception]]:
+        """
+        并发创建多个资产
+        
+        Args:
+            assets: 资产信息列表
+            
+        Returns:
+            List[Union[AssetInfo, Exception]]: 创建结果，失败的资产对应位置为异常对象
+        """
+        return self._run_concurrently(self.create_asset, assets)
+    
+    def bulk_update_assets(self, assets: List[AssetInfo]) -> List[Union[AssetInfo, Exception]]:
+        """
+        并发更新多个资产
+        
+        Args:
+            assets: 资产信息列表，每个资产必须包含id
+            
+        Returns:
+            List[Union[AssetInfo, Exception]]: 更新结果，失败的资产对应位置为异常对象
+        """
+        return self._run_concurrently(self._update_from_info, assets)
+    
+    def bulk_delete_assets(self, asset_ids: List[str]) -> List[Union[bool, Exception]]:
+        """
+        并发删除多个资产
+        
+        Args:
+            asset_ids: 资产ID列表
+            
+        Returns:
+            List[Union[bool, Exception]]: 删除结果，失败的资产对应位置为异常对象
+        """
+        return self._run_concurrently(self.delete_asset, asset_ids)
+    
+    def bulk_apply(self, to_create: List[AssetInfo], to_update: List[AssetInfo],
+                   to_delete: List[str]) -> Tuple[List[Any], List[Any], List[Any]]:
+        """
+        在同一个线程池中并发执行创建、更新和删除操作
+        
+        三类操作共用一个线程池，避免分三批执行时每批都要等待最慢的请求完成。
+        
+        Args:
+            to_create: 待创建的资产信息列表
+            to_update: 待更新的资产信息列表，每个资产必须包含id
+            to_delete: 待删除的资产ID列表
+            
+        Returns:
+            Tuple[List[Any], List[Any], List[Any]]: 创建、更新、删除的结果，
+                分别与输入顺序一致，失败的元素对应位置为异常对象
+        """
+        operations = ([(self.create_asset, item) for item in to_create]
+                      + [(self._update_from_info, item) for item in to_update]
+                      + [(self.delete_asset, item) for item in to_delete])
+        results = self._run_concurrently(lambda op: op[0](op[1]), operations)
+        
+        created_end = len(to_create)
+        updated_end = created_end + len(to_update)
+        return results[:created_end], results[created_end:updated_end], results[updated_end:]
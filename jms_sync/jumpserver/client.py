@@ -11,22 +11,91 @@ JumpServer客户端模块 - 负责与JumpServer API交互
 - 自动重试和缓存支持
 """
 
+import copy
 import json
 import time
 import logging
+import threading
+import functools
 import urllib.parse
+from collections import OrderedDict
 import requests
-from datetime import datetime
-from typing import Dict, List, Tuple, Any, Optional, Union, Set
+from requests.adapters import HTTPAdapter
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cached_property
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Dict, List, Tuple, Any, Optional, Union, Set, Iterator
 
 from httpsig.requests_auth import HTTPSignatureAuth
 
-from jms_sync.utils.exceptions import JumpServerError, JumpServerAPIError, JumpServerAuthError
+try:
+    import orjson
+except ImportError:  # orjson未安装时退回标准库json
+    orjson = None
+
+from jms_sync.utils.exceptions import (
+    JumpServerError, JumpServerAPIError, JumpServerAuthError, JumpServerRateLimitError
+)
 from jms_sync.utils.decorators import retry, log_execution_time
 from jms_sync.utils.logger import get_logger, StructuredLogger
 from jms_sync.jumpserver.models import AssetInfo, NodeInfo, SyncResult
 from jms_sync.jumpserver.asset_manager import AssetManager
 
+# 连接池设置，保证并发请求时复用长连接，避免重复TLS握手
+DEFAULT_POOL_CONNECTIONS = 4  # 缓存的主机连接池数量，客户端只访问一个JumpServer
+DEFAULT_POOL_MAXSIZE = 32  # 每个主机保持的最大连接数
+
+# 列表接口分页大小
+DEFAULT_PAGE_SIZE = 100
+
+# 完整URL缓存的最大条目数，避免带ID的端点使缓存无限增长
+URL_CACHE_SIZE = 256
+
+# 条件请求缓存的最大条目数，超过时淘汰最久未使用的条目
+VALIDATOR_CACHE_SIZE = 256
+
+
+@functools.lru_cache(maxsize=4)
+def _http_date(timestamp: int) -> str:
+    """生成RFC 1123格式的Date请求头，同一秒内直接复用缓存结果"""
+    return formatdate(timestamp, usegmt=True)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    解析Retry-After响应头
+    
+    Args:
+        value: 响应头的值，可以是秒数或HTTP日期
+        
+    Returns:
+        Optional[float]: 需要等待的秒数，无法解析时返回None
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """序列化请求体，优先使用orjson"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+
+def _json_loads(content: bytes) -> Any:
+    """解析响应体，优先使用orjson"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
 
 class JumpServerClient:
     """
@@ -68,6 +137,7 @@ class JumpServerClient:
         access_key_secret: str, 
         org_id: str = "00000000-0000-0000-0000-000000000002", 
         config: Optional[Dict[str, Any]] = None,
+        defer_connectivity_check: bool = False,
     ):
         """
         初始化JumpServer客户端
@@ -78,6 +148,7 @@ class JumpServerClient:
             access_key_secret: 访问密钥密钥
             org_id: 组织ID，默认为"00000000-0000-0000-0000-000000000002"
             config: 配置字典，包含协议端口、账号模板等配置
+            defer_connectivity_check: 是否跳过初始化时的连接测试，为True时由首次API请求验证连接
         """
         # 确保URL包含协议
         if base_url and not (base_url.startswith('http://') or base_url.startswith('https://')):
@@ -92,21 +163,41 @@ class JumpServerClient:
         self.access_key_secret = access_key_secret
         self.org_id = org_id
         self.config = config or {}  # 保存配置信息，包括账号模板等
+        self.max_workers = self.config.get('max_workers', 8)  # 并发请求的最大线程数
+        self.page_size = self.config.get('page_size', DEFAULT_PAGE_SIZE)  # 列表接口分页大小
+        self._ip_index: Optional[Dict[str, AssetInfo]] = None  # IP到资产的索引，由get_all_assets构建
+        self._name_index: Optional[Dict[str, AssetInfo]] = None  # 名称到资产的索引
+        self._asset_generation = 0  # 资产变更计数，索引构建期间发生变更时丢弃构建结果
+        self._asset_index_lock = threading.Lock()
+        self._nodes_by_key: Optional[Dict[str, NodeInfo]] = None  # 节点key到节点的索引，由get_nodes构建
+        self._nodes_by_path: Optional[Dict[str, NodeInfo]] = None  # 节点完整路径到节点的索引
+        self._verified = False  # 是否已有请求成功，用于确认连接可用
+        self._inflight: Dict[str, Future] = {}  # 进行中的GET请求，相同请求只发送一次
+        self._inflight_lock = threading.Lock()
+        self._url_cache: Dict[str, str] = {}  # 端点到完整URL的映射
+        # 条件请求缓存: 请求键 -> (校验头, 原始响应内容)，按最近使用顺序排列
+        self._validators: "OrderedDict[str, Tuple[Dict[str, str], Union[bytes, str]]]" = OrderedDict()
+        self._validators_lock = threading.Lock()
         self.logger = get_logger(__name__)
         self.structured_logger = StructuredLogger(__name__)
         
-        # 初始化HTTP签名认证
-        self.auth = self._get_auth()
-        
-        # 初始化会话
+        # 初始化会话，挂载连接池，重试由_api_request的retry装饰器负责
         self.session = requests.Session()
+        pool_size = self.config.get('http_pool_size', DEFAULT_POOL_MAXSIZE)
+        adapter = HTTPAdapter(
+            pool_connections=DEFAULT_POOL_CONNECTIONS,
+            pool_maxsize=pool_size,
+            max_retries=0
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         
-        # 设置默认请求头
-        self.session.headers.update({
+        # 预先构建固定请求头，每次请求只需复制并补充Date
+        self._base_headers = {
             'Content-Type': 'application/json',
             'X-JMS-ORG': org_id,
             'Accept': 'application/json'
-        })
+        }
         
         # 初始化资产管理器
         self.asset_manager = AssetManager(self)
@@ -116,8 +207,31 @@ class JumpServerClient:
         self.node_manager = JmsNodeManager(self)
         
         # 测试连接
-        self.test_connectivity()
+        if not defer_connectivity_check:
+            self.test_connectivity()
+        
+    def close(self) -> None:
+        """关闭会话，释放连接池中的连接"""
+        self.session.close()
+    
+    def __enter__(self) -> 'JumpServerClient':
+        """支持with语句，退出时自动关闭会话"""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+    
+    @cached_property
+    def auth(self) -> HTTPSignatureAuth:
+        """
+        HTTP签名认证，首次访问时创建，之后所有请求复用同一个对象：
+        httpsig在构造时完成HMAC密钥初始化，之后每次签名只复制该HMAC上下文
         
+        Returns:
+            HTTPSignatureAuth: HTTP签名认证对象
+        """
+        return self._get_auth()
+    
     def _get_auth(self) -> HTTPSignatureAuth:
         """
         获取HTTP签名认证
@@ -134,18 +248,84 @@ class JumpServerClient:
         )
         return auth
     
-    @retry(max_retries=3, retry_interval=2, exceptions=(requests.RequestException,))
     def _api_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        timeout: int = 30,
+        conditional: bool = False,
+        extra_headers: Optional[Dict[str, str]] = None
+    ) -> Any:
+        """
+        发送API请求
+        
+        多个线程同时发起相同的GET请求时，只有第一个请求实际发送，其余请求等待其结果，
+        并各自获得一份独立的副本，调用方可以安全地修改返回的数据。
+        
+        Args:
+            method: 请求方法，如"GET"、"POST"、"PUT"、"DELETE"
+            endpoint: API端点，如"/api/v1/assets/assets/"
+            params: 查询参数
+            data: 表单数据
+            json_data: JSON数据
+            timeout: 请求超时时间（秒）
+            conditional: 是否发送条件请求（仅GET），服务端返回304时复用上次的响应数据
+            extra_headers: 附加请求头
+            
+        Returns:
+            Any: 响应数据
+            
+        Raises:
+            JumpServerAPIError: API请求失败时抛出异常
+        """
+        if method != "GET" or extra_headers:
+            return self._send_request(
+                method, endpoint, params=params, data=data, json_data=json_data,
+                timeout=timeout, conditional=conditional, extra_headers=extra_headers
+            )
+        
+        key = ('C:' if conditional else 'U:') + self._validator_key(endpoint, params)
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+        
+        if not owner:
+            return copy.deepcopy(future.result())
+        
+        try:
+            result = self._send_request(
+                method, endpoint, params=params, timeout=timeout, conditional=conditional
+            )
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+    
+    @retry(max_retries=3, retry_interval=2, backoff_factor=2, max_interval=30, jitter=0.5,
+           exceptions=(requests.RequestException, JumpServerRateLimitError))
+    def _send_request(
         self, 
         method: str, 
         endpoint: str, 
         params: Optional[Dict[str, Any]] = None, 
         data: Optional[Dict[str, Any]] = None, 
         json_data: Optional[Dict[str, Any]] = None,
-        timeout: int = 30
+        timeout: int = 30,
+        conditional: bool = False,
+        extra_headers: Optional[Dict[str, str]] = None
     ) -> Any:
         """
-        发送API请求
+        实际发送API请求，失败时按重试策略重试
         
         Args:
             method: 请求方法，如"GET"、"POST"、"PUT"、"DELETE"
@@ -154,6 +334,8 @@ class JumpServerClient:
             data: 表单数据
             json_data: JSON数据
             timeout: 请求超时时间（秒）
+            conditional: 是否发送条件请求（仅GET），服务端返回304时复用上次的响应数据
+            extra_headers: 附加请求头
             
         Returns:
             Any: 响应数据
@@ -161,39 +343,68 @@ class JumpServerClient:
         Raises:
             JumpServerAPIError: API请求失败时抛出异常
         """
-        # 构建URL
-        url = f"{self.base_url}{endpoint}"
+        # 构建URL，常用端点直接复用
+        url = self._url_cache.get(endpoint)
+        if url is None:
+            url = self.base_url + endpoint
+            if len(self._url_cache) < URL_CACHE_SIZE:
+                self._url_cache[endpoint] = url
         
         # 设置请求头
-        headers = {
-            'Date': datetime.utcnow().strftime('%a, %d %b %Y %H:%M:%S GMT')
-        }
+        headers = self._base_headers.copy()
+        headers['Date'] = _http_date(int(time.time()))
+        if extra_headers:
+            headers.update(extra_headers)
         
-        # 记录请求信息
-        self.structured_logger.debug(
-            f"发送请求: {method} {url}",
-            params=params,
-            json_data=json_data if json_data else None
-        )
+        # 条件请求：携带上次响应的ETag/Last-Modified
+        cache_key = None
+        cached = None
+        if conditional and method == "GET":
+            cache_key = self._validator_key(url, params)
+            with self._validators_lock:
+                cached = self._validators.get(cache_key)
+                if cached:
+                    self._validators.move_to_end(cache_key)
+            if cached:
+                headers.update(cached[0])
+        
+        # 记录请求信息，DEBUG未开启时跳过消息拼接
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            self.structured_logger.debug(
+                f"发送请求: {method} {url}",
+                params=params,
+                json_data=json_data if json_data else None
+            )
         
         try:
+            # 请求体直接序列化为bytes，Content-Type已在固定请求头中设置
+            if json_data is not None:
+                data = _json_dumps(json_data)
+            
             response = self.session.request(
                 method=method,
                 url=url,
                 params=params,
                 data=data,
-                json=json_data,
                 headers=headers,
                 auth=self.auth,
                 timeout=timeout
             )
             
             # 记录响应状态
-            self.structured_logger.debug(
-                f"接收响应: {method} {url}",
-                status_code=response.status_code,
-                reason=response.reason
-            )
+            if debug_enabled:
+                self.structured_logger.debug(
+                    f"接收响应: {method} {url}",
+                    status_code=response.status_code,
+                    reason=response.reason
+                )
+            
+            # 资源未变化，重新解析缓存的原始内容，调用方拿到的是独立的对象
+            if response.status_code == 304 and cached:
+                self.logger.debug("资源未变化，使用缓存数据: %s", url)
+                content = cached[1]
+                return _json_loads(content) if isinstance(content, bytes) else content
             
             # 解析响应
             if response.status_code >= 400:
@@ -214,6 +425,13 @@ class JumpServerClient:
                 # 根据状态码抛出特定异常
                 if response.status_code == 401:
                     raise JumpServerAuthError(f"认证失败: {response.text}")
+                elif response.status_code in (429, 503):
+                    raise JumpServerRateLimitError(
+                        message=f"API请求被限流: {response.status_code} {response.reason}",
+                        retry_after=_parse_retry_after(response.headers.get('Retry-After')),
+                        status_code=response.status_code,
+                        response=response.text
+                    )
                 else:
                     raise JumpServerAPIError(
                         message=f"API请求失败: {response.status_code} {response.reason}",
@@ -221,15 +439,215 @@ class JumpServerClient:
                         response=response.text
                     )
             
+            if not self._verified:
+                self._verified = True
+            
             # 尝试解析JSON响应
             if response.headers.get('Content-Type', '').startswith('application/json'):
-                return response.json()
+                content = response.content
+                result = _json_loads(content)
             else:
-                return response.text
+                content = result = response.text
+            
+            if cache_key is not None:
+                self._store_validators(cache_key, response, content)
+            return result
         except requests.RequestException as e:
             self.structured_logger.error(f"请求异常: {str(e)}", url=url, method=method)
             raise
     
+    @staticmethod
+    def _validator_key(url: str, params: Optional[Dict[str, Any]]) -> str:
+        """
+        生成条件请求缓存键
+        
+        Args:
+            url: 请求URL
+            params: 查询参数
+            
+        Returns:
+            str: 缓存键
+        """
+        if not params:
+            return url
+        return f"{url}?{urllib.parse.urlencode(sorted(params.items()), doseq=True)}"
+    
+    def _store_validators(self, cache_key: str, response: requests.Response, content: Union[bytes, str]) -> None:
+        """
+        保存响应的ETag/Last-Modified，供下次条件请求使用
+        
+        保存的是原始响应内容而不是解析后的对象，304时重新解析，
+        避免调用方修改返回结果后污染缓存。超过VALIDATOR_CACHE_SIZE时淘汰最久未使用的条目。
+        
+        Args:
+            cache_key: 缓存键
+            response: 响应对象
+            content: 原始响应内容，JSON响应为bytes，其他为str
+        """
+        validators = {}
+        etag = response.headers.get('ETag')
+        if etag:
+            validators['If-None-Match'] = etag
+        last_modified = response.headers.get('Last-Modified')
+        if last_modified:
+            validators['If-Modified-Since'] = last_modified
+        
+        with self._validators_lock:
+            if validators:
+                self._validators[cache_key] = (validators, content)
+                self._validators.move_to_end(cache_key)
+                while len(self._validators) > VALIDATOR_CACHE_SIZE:
+                    self._validators.popitem(last=False)
+            else:
+                self._validators.pop(cache_key, None)
+    
+    def request_many(
+        self,
+        calls: List[Tuple[str, str, Optional[Dict[str, Any]]]],
+        max_workers: Optional[int] = None,
+        conditional: bool = False
+    ) -> List[Any]:
+        """
+        并发发送多个API请求，所有请求共享同一个会话和连接池
+        
+        Args:
+            calls: 请求列表，每项为(method, endpoint, params)
+            max_workers: 最大并发线程数，默认使用配置中的max_workers
+            conditional: 是否发送条件请求
+            
+        Returns:
+            List[Any]: 响应数据列表，顺序与calls一致
+            
+        Raises:
+            JumpServerAPIError: 任一请求失败时抛出异常
+        """
+        if not calls:
+            return []
+        if len(calls) == 1:
+            method, endpoint, params = calls[0]
+            return [self._api_request(method, endpoint, params=params, conditional=conditional)]
+        
+        workers = min(max_workers or self.max_workers, len(calls))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self._api_request, method, endpoint, params=params, conditional=conditional)
+                for method, endpoint, params in calls
+            ]
+            return [future.result() for future in futures]
+    
+    def _get_paginated(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        page_size: Optional[int] = None,
+        conditional: bool = False
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        获取列表接口的全部数据
+        
+        先请求第一页获取总数，再并发请求剩余分页。如果调用方已指定limit/offset，
+        则只请求调用方指定的那一页。
+        
+        Args:
+            endpoint: API端点
+            params: 查询参数
+            page_size: 每页数量，默认使用配置中的page_size
+            conditional: 是否对每个分页发送条件请求
+            
+        Returns:
+            Optional[List[Dict[str, Any]]]: 全部数据项，响应格式无法识别时返回None
+        """
+        params = dict(params or {})
+        page_size = page_size or self.page_size
+        paginate = 'limit' not in params and 'offset' not in params
+        if paginate:
+            params['limit'] = page_size
+            params['offset'] = 0
+        
+        first = self._api_request("GET", endpoint, params=params, conditional=conditional)
+        if isinstance(first, list):
+            return first
+        if not isinstance(first, dict) or 'results' not in first:
+            return None
+        
+        items = list(first['results'])
+        count = first.get('count') or 0
+        if not paginate or count <= len(items):
+            return items
+        
+        # 已知总数后，剩余分页并发获取
+        calls = [
+            ("GET", endpoint, {**params, 'offset': offset})
+            for offset in range(page_size, count, page_size)
+        ]
+        for page in self.request_many(calls, conditional=conditional):
+            if isinstance(page, dict):
+                items.extend(page.get('results', []))
+        return items
+    
+    def _iter_paginated(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        page_size: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        逐页获取列表接口数据并逐项返回，内存中同一时间最多保留两页数据
+        
+        调用方处理当前页时，下一页已在后台线程中请求，网络等待与数据处理重叠。
+        
+        Args:
+            endpoint: API端点
+            params: 查询参数
+            page_size: 每页数量，默认使用配置中的page_size
+            
+        Yields:
+            Dict[str, Any]: 数据项
+        """
+        params = dict(params or {})
+        params['limit'] = page_size or self.page_size
+        
+        def fetch(offset: int) -> Any:
+            return self._api_request("GET", endpoint, params={**params, 'offset': offset})
+        
+        offset = 0
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            page = fetch(offset)
+            while True:
+                if isinstance(page, list):
+                    yield from page
+                    return
+                if not isinstance(page, dict):
+                    return
+                
+                results = page.get('results') or []
+                offset += len(results)
+                
+                # 先发起下一页请求，再返回当前页数据
+                future = None
+                if results and page.get('next') and offset < (page.get('count') or 0):
+                    future = executor.submit(fetch, offset)
+                
+                yield from results
+                
+                if future is None:
+                    return
+                page = future.result()
+    
+    def iter_assets(self, params: Optional[Dict[str, Any]] = None) -> Iterator[AssetInfo]:
+        """
+        逐个返回资产，适用于资产数量较大、不希望一次性载入全部资产的场景
+        
+        Args:
+            params: 查询参数，如筛选条件
+            
+        Yields:
+            AssetInfo: 资产信息
+        """
+        parse = self.asset_manager._parse_asset_data
+        for item in self._iter_paginated("/api/v1/assets/hosts/", params=params):
+            yield parse(item)
+    
     def test_connectivity(self) -> bool:
         """
         测试与JumpServer的连接
@@ -240,20 +658,25 @@ class JumpServerClient:
         Raises:
             JumpServerError: 连接失败时抛出异常
         """
+        # 已有签名请求成功，说明连接和认证均可用，无需再发测试请求
+        if self._verified:
+            self.logger.debug("已有请求成功，跳过JumpServer连接测试")
+            return True
+        
         try:
-            self.logger.info(f"测试与JumpServer的连接: {self.base_url}")
+            self.logger.info("测试与JumpServer的连接: %s", self.base_url)
             # 调用一个轻量级接口来测试连接
-            response = self._api_request("GET", "/api/v1/terminal/status/")
+            response = self._api_request("GET", "/api/v1/terminal/status/", conditional=True)
             self.logger.info("JumpServer连接测试成功")
             return True
         except JumpServerAuthError as e:
-            self.logger.error(f"JumpServer认证失败: {str(e)}")
+            self.logger.error("JumpServer认证失败: %s", e)
             raise JumpServerError(f"JumpServer认证失败: {str(e)}")
         except JumpServerAPIError as e:
-            self.logger.error(f"JumpServer API错误: {str(e)}")
+            self.logger.error("JumpServer API错误: %s", e)
             raise JumpServerError(f"JumpServer API错误: {str(e)}")
         except Exception as e:
-            self.logger.error(f"连接JumpServer失败: {str(e)}")
+            self.logger.error("连接JumpServer失败: %s", e)
             raise JumpServerError(f"连接JumpServer失败: {str(e)}")
     
     # 为了向后兼容，添加test_connection作为test_connectivity的别名
@@ -286,6 +709,19 @@ class JumpServerClient:
         """
         return self.asset_manager.get_assets_by_node_id(node_id)
 
+    # 兼容方法 - 转发到asset_manager
+    def get_assets_by_nodes(self, node_ids: List[str]) -> Dict[str, List[AssetInfo]]:
+        """
+        并发获取多个节点下的资产 (兼容方法)
+        
+        Args:
+            node_ids: 节点ID列表
+            
+        Returns:
+            Dict[str, List[AssetInfo]]: 节点ID到资产列表的映射
+        """
+        return self.asset_manager.get_assets_by_node_ids(node_ids)
+
     def get_assets(self, params: Optional[Dict[str, Any]] = None, force_refresh: bool = False) -> List[AssetInfo]:
         """
         获取资产列表 (已废弃)
@@ -308,17 +744,37 @@ class JumpServerClient:
             params = {}
             
         try:
-            response = self._api_request("GET", "/api/v1/assets/hosts/", params=params)
-            assets = []
-            
-            if isinstance(response, dict) and 'results' in response:
-                for item in response['results']:
-                    assets.append(self.asset_manager._parse_asset_data(item))
-            return assets
+            items = self._get_paginated(
+                "/api/v1/assets/hosts/", params=params, conditional=not force_refresh
+            ) or []
+            return self.asset_manager._parse_assets(items)
         except Exception as e:
-            self.logger.error(f"获取资产列表失败: {str(e)}")
+            self.logger.error("获取资产列表失败: %s", e)
             return []
     
+    def fetch_sync_snapshot(self, node_ids: List[str]) -> Tuple[List[NodeInfo], Dict[str, List[AssetInfo]]]:
+        """
+        一次性获取节点列表及指定节点下的资产
+        
+        节点列表使用条件请求分页获取，未变化的分页由服务端返回304；资产按节点
+        并发查询，结果与get_assets_by_node一致（包含子节点下的资产）。
+        
+        Args:
+            node_ids: 需要获取资产的节点ID列表
+            
+        Returns:
+            Tuple[List[NodeInfo], Dict[str, List[AssetInfo]]]: 节点列表，以及节点ID到资产列表的映射
+            
+        Raises:
+            JumpServerAPIError: API请求失败时抛出异常
+        """
+        items = self._get_paginated("/api/v1/assets/nodes/", conditional=True)
+        if items is None:
+            self.logger.warning("获取节点列表返回意外格式")
+            items = []
+        nodes = NodeInfo.from_dict_list(items)
+        return nodes, self.get_assets_by_nodes(node_ids)
+    
     def get_all_assets(self) -> List[AssetInfo]:
         """
         获取所有资产 (已废弃)
@@ -329,7 +785,26 @@ class JumpServerClient:
             List[AssetInfo]: 所有资产列表
         """
         self.logger.warning("get_all_assets方法已废弃，请使用AssetManager类管理资产")
-        return self.get_assets()
+        with self._asset_index_lock:
+            generation = self._asset_generation
+        assets = self.get_assets()
+        
+        # 构建索引，后续按IP/名称查询无需再请求API
+        ip_index = {asset.address: asset for asset in assets if asset.address}
+        name_index = {asset.name: asset for asset in assets if asset.name}
+        with self._asset_index_lock:
+            # 获取期间资产已变更，数据可能过期，不写入索引
+            if generation == self._asset_generation:
+                self._ip_index = ip_index
+                self._name_index = name_index
+        return assets
+    
+    def _invalidate_asset_index(self) -> None:
+        """资产发生变更后清除IP/名称索引，由AssetManager的写操作在请求成功后调用"""
+        with self._asset_index_lock:
+            self._asset_generation += 1
+            self._ip_index = None
+            self._name_index = None
     
     def get_asset_by_ip(self, ip: str) -> Optional[AssetInfo]:
         """
@@ -344,6 +819,10 @@ class JumpServerClient:
             Optional[AssetInfo]: 资产信息，如果不存在则返回None
         """
         self.logger.warning("get_asset_by_ip方法已废弃，请使用AssetManager类管理资产")
+        ip_index = self._ip_index
+        if ip_index is not None and ip in ip_index:
+            return ip_index[ip]
+        
         params = {'ip': ip}
         assets = self.get_assets(params)
         if assets:
@@ -363,6 +842,10 @@ class JumpServerClient:
             Optional[AssetInfo]: 资产信息，如果不存在则返回None
         """
         self.logger.warning("get_asset_by_name方法已废弃，请使用AssetManager类管理资产")
+        name_index = self._name_index
+        if name_index is not None and name in name_index:
+            return name_index[name]
+        
         params = {'name': name}
         assets = self.get_assets(params)
         if assets:
@@ -451,23 +934,25 @@ class JumpServerClient:
             params = {}
         
         try:
-            response = self._api_request("GET", endpoint, params=params)
-            if isinstance(response, dict) and 'results' in response:
-                nodes = []
-                for item in response['results']:
-                    nodes.append(NodeInfo.from_dict(item))
-                return nodes
-            elif isinstance(response, list):
-                nodes = []
-                for item in response:
-                    nodes.append(NodeInfo.from_dict(item))
-                return nodes
-            else:
-                self.logger.warning(f"获取节点列表返回意外格式: {response}")
+            items = self._get_paginated(endpoint, params=params, conditional=not force_refresh)
+            if items is None:
+                self.logger.warning("获取节点列表返回意外格式")
                 return []
+            nodes = NodeInfo.from_dict_list(items)
         except Exception as e:
-            self.logger.error(f"获取节点列表失败: {str(e)}")
+            self.logger.error("获取节点列表失败: %s", e)
             return []
+        
+        # 全量获取时构建key/路径索引，后续查询无需遍历节点列表
+        if not params:
+            self._nodes_by_key = {node.key: node for node in nodes if node.key}
+            self._nodes_by_path = {node.full_value: node for node in nodes if node.full_value}
+        return nodes
+    
+    def _invalidate_node_index(self) -> None:
+        """节点发生变更后清除key/路径索引"""
+        self._nodes_by_key = None
+        self._nodes_by_path = None
     
     def get_node_by_key(self, key: str) -> Optional[NodeInfo]:
         """
@@ -482,8 +967,25 @@ class JumpServerClient:
             Optional[NodeInfo]: 节点信息，如果不存在则返回None
         """
         self.logger.warning("get_node_by_key方法已废弃，请使用JmsNodeManager类管理节点")
-        return None
+        if self._nodes_by_key is None:
+            self.get_nodes()
+        return (self._nodes_by_key or {}).get(key)
+        
+    def get_nodes_by_keys(self, keys: List[str]) -> Dict[str, NodeInfo]:
+        """
+        批量通过Key获取节点，最多只需一次全量节点请求
         
+        Args:
+            keys: 节点Key列表
+            
+        Returns:
+            Dict[str, NodeInfo]: 节点Key到节点信息的映射，不存在的Key不会出现在结果中
+        """
+        if self._nodes_by_key is None:
+            self.get_nodes()
+        index = self._nodes_by_key or {}
+        return {key: index[key] for key in keys if key in index}
+    
     def get_node_by_full_path(self, path: str) -> Optional[NodeInfo]:
         """
         通过完整路径获取节点 (已废弃)
@@ -497,8 +999,25 @@ class JumpServerClient:
             Optional[NodeInfo]: 节点信息，如果不存在则返回None
         """
         self.logger.warning("get_node_by_full_path方法已废弃，请使用JmsNodeManager类管理节点")
-        return None
+        if self._nodes_by_path is None:
+            self.get_nodes()
+        return (self._nodes_by_path or {}).get(path)
+        
+    def get_nodes_by_full_paths(self, paths: List[str]) -> Dict[str, Optional[NodeInfo]]:
+        """
+        批量通过完整路径获取节点，最多只需一次全量节点请求
         
+        Args:
+            paths: 节点完整路径列表
+            
+        Returns:
+            Dict[str, Optional[NodeInfo]]: 路径到节点信息的映射，不存在的路径对应None
+        """
+        if self._nodes_by_path is None:
+            self.get_nodes()
+        index = self._nodes_by_path or {}
+        return {path: index.get(path) for path in paths}
+    
     def create_node(self, node_info: NodeInfo) -> NodeInfo:
         """
         创建节点 (已废弃)
@@ -5,10 +5,43 @@
 JumpServer 数据模型模块，定义与JumpServer交互的数据结构。
 """
 
-from typing import Dict, List, Optional, Any, Set, Union
-from dataclasses import dataclass, field
+import time
+import functools
+from typing import Dict, List, Optional, Any
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 
+
+@functools.lru_cache(maxsize=1)
+def _iso_timestamp(second: int) -> str:
+    """生成秒级精度的ISO格式本地时间，同一秒内的调用直接复用缓存结果"""
+    return datetime.fromtimestamp(second).isoformat()
+
+
+def _slotted(cls):
+    """
+    为数据类添加__slots__，实例不再携带__dict__，节省内存并加快属性访问。
+
+    等价于Python 3.10+的dataclass(slots=True)，用于兼容低版本Python。
+
+    Args:
+        cls: 已被@dataclass处理的类
+
+    Returns:
+        Type: 带__slots__的新类
+    """
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict = dict(cls.__dict__)
+    cls_dict['__slots__'] = field_names
+    # 字段默认值已内联到生成的__init__中，类属性会与同名slot冲突
+    for name in field_names:
+        cls_dict.pop(name, None)
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+
+@_slotted
 @dataclass
 class AssetInfo:
     """资产信息数据类"""
@@ -28,8 +61,8 @@ class AssetInfo:
     node: Optional[str] = None
     node_id: Optional[str] = None
     comment: Optional[str] = None
-    attrs: Dict[str, Any] = field(default_factory=dict)
-    accounts: List[Dict[str, Any]] = field(default_factory=list)  # 添加accounts字段支持账号模板
+    attrs: Optional[Dict[str, Any]] = None  # 为None表示无附加属性，避免每个实例都分配空字典
+    accounts: Optional[List[Dict[str, Any]]] = None  # 添加accounts字段支持账号模板，为None表示无账号
     
     def __post_init__(self):
         """
@@ -64,7 +97,9 @@ class AssetInfo:
         Returns:
             bool: 是否相等
         """
-        if not isinstance(other, AssetInfo):
+        if self is other:
+            return True
+        if type(other) is not AssetInfo:
             return False
         
         # 如果两者都有id，比较id
@@ -105,7 +140,7 @@ class AssetInfo:
             data["comment"] = self.comment
         if self.attrs:
             data["attrs"] = self.attrs
-        if hasattr(self, 'accounts') and self.accounts:
+        if self.accounts:
             data["accounts"] = self.accounts
             
         return data
@@ -121,49 +156,57 @@ class AssetInfo:
         Returns:
             AssetInfo: 资产信息对象
         """
+        get = data.get
+        
         # 处理address和ip字段兼容性
-        ip = data.get("ip", "")
-        address = data.get("address", "")
+        ip = get("ip", "")
+        address = get("address", "")
         if not address and ip:
             address = ip
         elif not ip and address:
             ip = address
         
-        asset = cls(
-            id=data.get("id"),
-            name=data.get("name", ""),
-            ip=ip,
-            address=address,
-            platform=data.get("platform", "Linux"),
-            protocol=data.get("protocol", "ssh"),
-            port=data.get("port", 22),
-            is_active=data.get("is_active", True),
-            public_ip=data.get("public_ip"),
-            comment=data.get("comment")
-        )
-        
-        # 处理关系字段
-        if "domain" in data:
-            asset.domain_id = data["domain"]
-        
-        if "admin_user" in data:
-            asset.admin_user_id = data["admin_user"]
-        
         # 处理节点，JumpServer API中节点是一个列表
-        nodes = data.get("nodes", [])
-        if nodes and isinstance(nodes, list) and len(nodes) > 0:
-            asset.node_id = nodes[0]
-        
-        # 处理属性字段
-        asset.attrs = data.get("attrs", {})
-        
-        # 处理账号信息字段
-        if "accounts" in data:
-            asset.accounts = data["accounts"]
+        nodes = get("nodes")
         
+        # 跳过__init__和__post_init__直接填充各字段，新增字段时需同步修改此处
+        asset = object.__new__(cls)
+        asset.id = get("id")
+        asset.name = get("name", "")
+        asset.ip = ip
+        asset.address = address
+        asset.platform = get("platform", "Linux")
+        asset.protocol = get("protocol", "ssh")
+        asset.port = get("port", 22)
+        asset.is_active = get("is_active", True)
+        asset.public_ip = get("public_ip")
+        asset.domain = None
+        asset.domain_id = get("domain")
+        asset.admin_user = None
+        asset.admin_user_id = get("admin_user")
+        asset.node = None
+        asset.node_id = nodes[0] if nodes and isinstance(nodes, list) else None
+        asset.comment = get("comment")
+        asset.attrs = get("attrs")
+        asset.accounts = get("accounts")
         return asset
+    
+    @classmethod
+    def from_dict_list(cls, items: List[Dict[str, Any]]) -> List['AssetInfo']:
+        """
+        从字典列表批量创建资产信息对象。
+        
+        Args:
+            items: 资产信息字典列表
+            
+        Returns:
+            List[AssetInfo]: 资产信息对象列表
+        """
+        from_dict = cls.from_dict
+        return [from_dict(item) for item in items]
 
 
+@_slotted
 @dataclass
 class NodeInfo:
     """节点信息数据类"""
@@ -199,7 +242,9 @@ class NodeInfo:
         Returns:
             bool: 是否相等
         """
-        if not isinstance(other, NodeInfo):
+        if self is other:
+            return True
+        if type(other) is not NodeInfo:
             return False
         
         # 如果两者都有id，比较id
@@ -241,26 +286,34 @@ class NodeInfo:
         Returns:
             NodeInfo: 节点信息对象
         """
-        node = cls(
-            id=data.get("id"),
-            name=data.get("name", ""),
-            key=data.get("key", ""),
-            value=data.get("value", ""),
-            parent=data.get("parent"),
-            assets_amount=data.get("assets_amount", 0)
+        get = data.get
+        return cls(
+            id=get("id"),
+            name=get("name", ""),
+            key=get("key", ""),
+            value=get("value", ""),
+            parent=get("parent"),
+            parent_key=get("parent_key"),
+            assets_amount=get("assets_amount", 0),
+            full_value=get("full_value")
         )
+    
+    @classmethod
+    def from_dict_list(cls, items: List[Dict[str, Any]]) -> List['NodeInfo']:
+        """
+        从字典列表批量创建节点信息对象。
         
-        # 处理父节点key
-        if "parent_key" in data:
-            node.parent_key = data["parent_key"]
-        
-        # 处理完整路径
-        if "full_value" in data:
-            node.full_value = data["full_value"]
+        Args:
+            items: 节点信息字典列表
             
-        return node
+        Returns:
+            List[NodeInfo]: 节点信息对象列表
+        """
+        from_dict = cls.from_dict
+        return [from_dict(item) for item in items]
 
 
+@_slotted
 @dataclass
 class SyncResult:
     """同步结果数据类"""
@@ -364,7 +417,7 @@ class SyncResult:
             "instance_id": instance_id,
             "operation": operation,
             "message": error_message,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _iso_timestamp(int(time.time()))
         }
         
         if details:
@@ -5,10 +5,48 @@
 JmsNodeManager: 严格遵循《jms节点创建查询逻辑.md》实现JumpServer节点的查询、创建、存储
 """
 from typing import Dict, Any, Optional, List, Union
+import os
+import json
+import time
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from jms_sync.jumpserver.models import NodeInfo
 
+# 子节点列表缓存时间（秒），同一父节点下的多次查找只请求一次
+CHILDREN_CACHE_TTL = 60
+
+# 节点缓存文件格式版本，格式变化时递增，版本不一致的文件直接忽略
+NODE_CACHE_VERSION = 1
+
+# 缺少meta数据时返回的空字典，只读
+_EMPTY_META: Dict[str, Any] = {}
+
+
+def _node_meta(node: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    提取节点树接口返回项中的meta.data，缺失时不分配新的空字典
+    
+    Args:
+        node: 节点树接口返回的单项
+        
+    Returns:
+        Dict[str, Any]: 节点数据
+    """
+    try:
+        return node["meta"]["data"] or _EMPTY_META
+    except (KeyError, TypeError):
+        return _EMPTY_META
+
 class JmsNodeManager:
+    # 根节点默认存在，无需查询，使用文档提供的固定值（只读，请勿修改）
+    ROOT_NODE = {
+        "key_id": "1",
+        "id": "f7409c89-af14-4417-954c-a4744f8b11e1",
+        "value": "DEFAULT",
+        "full_value": "/DEFAULT"
+    }
+
     def __init__(self, js_client, logger: Optional[logging.Logger] = None):
         """
         初始化节点管理器
@@ -21,20 +59,153 @@ class JmsNodeManager:
         self.logger = logger or logging.getLogger(__name__)
         self.nodes_map = {}  # 嵌套字典结构，仅在当前运行期间有效
         self.root_key = "1"  # 根节点key固定为1
-        self.root_id = None  # 根节点ID
+        self.root_id = self.ROOT_NODE["id"]  # 根节点ID
         # 缓存已被移除，使用变量在会话期间保存节点信息
         self.nodes_session = {}  # 路径到节点的映射，仅在当前运行期间有效
+        self._nodes_by_id = {}  # 节点ID到节点的映射，与nodes_session同步维护
+        self._path_by_id = {}  # 节点ID到会话中路径的映射，删除节点时无需查找路径
+        self._children_cache = {}  # 父节点key -> (获取时间, 子节点名称到节点的映射)
+        self._created_children = {}  # 父节点key -> {子节点名称: (创建时间, 节点)}，用于合并请求期间新建的子节点
+        self._unverified = set()  # 从缓存文件加载、本次运行尚未确认仍存在的节点路径
+        self._lock = threading.Lock()  # 保护nodes_session、ID索引与子节点缓存的更新
+        # 可选的节点缓存文件，配置后节点信息跨运行保留，省去每次启动时的节点查询
+        self.cache_file = getattr(js_client, 'config', {}).get('node_cache_file')
+        self._load_cache()
         self._init_root_node()
 
+    def _load_cache(self):
+        """
+        从缓存文件加载节点信息
+        
+        文件不存在、格式版本不同或属于其他JumpServer/组织时忽略。加载的节点标记为未确认，
+        首次使用时由_session_node向服务端确认仍然存在。
+        """
+        if not self.cache_file or not os.path.exists(self.cache_file):
+            return
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            if (cache.get("version") != NODE_CACHE_VERSION
+                    or cache.get("base_url") != getattr(self.js_client, 'base_url', None)
+                    or cache.get("org_id") != getattr(self.js_client, 'org_id', None)):
+                self.logger.debug("节点缓存文件与当前JumpServer或组织不匹配，忽略: %s", self.cache_file)
+                return
+            for path, node in cache.get("nodes", {}).items():
+                if path == "/DEFAULT":
+                    continue
+                self._store(path, node)
+                with self._lock:
+                    self._unverified.add(path)
+            self.logger.debug("从缓存文件加载%s个节点: %s", len(self._unverified), self.cache_file)
+        except (OSError, ValueError, AttributeError) as e:
+            self.logger.warning("读取节点缓存文件失败: %s", e)
+
+    def _session_node(self, path: str) -> Optional[Dict[str, Any]]:
+        """
+        获取会话中的节点，来自缓存文件的节点在本次运行首次使用时确认仍然存在
+        
+        节点已在服务端被删除（或删除后重建，ID已变化）时返回404，此时移出会话，
+        由调用方重新按路径查找或创建。
+        
+        Args:
+            path: 节点完整路径
+            
+        Returns:
+            Optional[Dict[str, Any]]: 节点信息，会话中没有或节点已不存在时返回None
+        """
+        node_info = self.nodes_session.get(path)
+        if node_info is None or path not in self._unverified:
+            return node_info
+        
+        with self._lock:
+            self._unverified.discard(path)
+        try:
+            self.js_client._api_request("GET", f"/api/v1/assets/nodes/{node_info['id']}/")
+        except Exception as e:
+            if getattr(e, 'status_code', None) == 404:
+                self.logger.info("缓存的节点已不存在，重新查找: %s (ID: %s)", path, node_info['id'])
+                self._discard(path)
+                return None
+            self.logger.warning("确认缓存节点%s失败，继续使用缓存: %s", path, e)
+        return node_info
+
+    def _store(self, path: str, node_info: Dict[str, Any]):
+        """
+        保存节点到会话，同时更新ID索引
+        
+        Args:
+            path: 节点完整路径
+            node_info: 节点信息
+        """
+        with self._lock:
+            self.nodes_session[path] = node_info
+            self._unverified.discard(path)
+            if node_info.get("id"):
+                self._nodes_by_id[node_info["id"]] = node_info
+                self._path_by_id[node_info["id"]] = path
+
+    def _store_by_id(self, node_id: str, node_info: Dict[str, Any]):
+        """
+        只更新ID索引，用于没有完整路径的节点
+        
+        Args:
+            node_id: 节点ID
+            node_info: 节点信息
+        """
+        with self._lock:
+            self._nodes_by_id[node_id] = node_info
+
+    def _discard(self, path: str):
+        """
+        从会话和ID索引中移除节点
+        
+        Args:
+            path: 节点完整路径
+        """
+        with self._lock:
+            self._discard_unlocked(path)
+
+    def _discard_unlocked(self, path: str):
+        """
+        从会话和ID索引中移除节点，调用方需持有self._lock
+        
+        Args:
+            path: 节点完整路径
+        """
+        node_info = self.nodes_session.pop(path, None)
+        self._unverified.discard(path)
+        if node_info and node_info.get("id"):
+            self._nodes_by_id.pop(node_info["id"], None)
+            self._path_by_id.pop(node_info["id"], None)
+
+    def save_cache(self):
+        """将当前会话中的节点信息写入缓存文件"""
+        if not self.cache_file:
+            return
+        try:
+            directory = os.path.dirname(self.cache_file)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory, exist_ok=True)
+            # 在锁内复制快照，避免其他线程写入节点时序列化过程中字典大小变化
+            with self._lock:
+                nodes = dict(self.nodes_session)
+            cache = {
+                "version": NODE_CACHE_VERSION,
+                "base_url": getattr(self.js_client, 'base_url', None),
+                "org_id": getattr(self.js_client, 'org_id', None),
+                "nodes": nodes
+            }
+            tmp_file = f"{self.cache_file}.tmp"
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, ensure_ascii=False)
+            os.replace(tmp_file, self.cache_file)
+        except OSError as e:
+            self.logger.warning("写入节点缓存文件失败: %s", e)
+
     def _init_root_node(self):
         """初始化根节点"""
-        root_node = self._get_root_node()
-        if root_node:
-            self.root_id = root_node["id"]
-            self.nodes_session["/DEFAULT"] = root_node
-            self.logger.debug(f"根节点初始化成功: ID={self.root_id}")
-        else:
-            self.logger.warning("根节点初始化失败")
+        self._store("/DEFAULT", self.ROOT_NODE)
+        self.logger.debug("根节点初始化成功: ID=%s", self.root_id)
 
     def init_nodes(self, cloud_type: str, cloud_name: str):
         """
@@ -44,17 +215,18 @@ class JmsNodeManager:
             cloud_type: 云平台类型，用于创建二级节点
             cloud_name: 云平台名称，用于创建三级节点
         """
-        # 1. 获取根节点
-        root_node = self._get_root_node()
-        if not root_node:
-            raise Exception("未找到JumpServer根节点/DEFAULT")
-        self.root_id = root_node["id"]
-        
-        # 2. 获取或创建二级节点
-        second_node = self._get_or_create_child_node(self.root_id, self.root_key, cloud_type)
+        # 1. 根节点固定存在，见ROOT_NODE
+        # 2. 获取或创建二级节点，同类型的多个云平台共用二级节点，会话中已有时无需再次查询
+        second_path = f"/DEFAULT/{cloud_type}"
+        second_node = self._session_node(second_path)
+        if not second_node:
+            second_node = self._get_or_create_child_node(self.root_id, self.root_key, cloud_type)
         
         # 3. 获取或创建三级节点
-        third_node = self._get_or_create_child_node(second_node["id"], second_node["key_id"], cloud_name)
+        third_path = f"{second_path}/{cloud_name}"
+        third_node = self._session_node(third_path)
+        if not third_node:
+            third_node = self._get_or_create_child_node(second_node["id"], second_node["key_id"], cloud_name)
         
         # 4. 构建嵌套字典
         self.nodes_map = {
@@ -73,10 +245,11 @@ class JmsNodeManager:
         }
         
         # 5. 更新会话中的节点信息
-        self.nodes_session[f"/DEFAULT/{cloud_type}"] = second_node
-        self.nodes_session[f"/DEFAULT/{cloud_type}/{cloud_name}"] = third_node
+        self._store(second_path, second_node)
+        self._store(third_path, third_node)
+        self.save_cache()
         
-        self.logger.info(f"节点结构初始化完成: {self.nodes_map}")
+        self.logger.info("节点结构初始化完成: %s", self.nodes_map)
 
     def _get_root_node(self) -> Dict[str, Any]:
         """
@@ -85,15 +258,8 @@ class JmsNodeManager:
         Returns:
             Dict[str, Any]: 根节点信息
         """
-        # 文档中明确指出根节点默认存在，无需查询，使用文档提供的默认值
-        root_node = {
-            "key_id": "1",
-            "id": "f7409c89-af14-4417-954c-a4744f8b11e1",
-            "value": "DEFAULT",
-            "full_value": "/DEFAULT"
-        }
-        self.logger.debug("使用默认根节点信息")
-        return root_node
+        # 文档中明确指出根节点默认存在，无需查询，直接返回固定值
+        return self.ROOT_NODE
 
     def _get_or_create_child_node(self, parent_id: str, parent_key: str, value: str) -> Dict[str, Any]:
         """
@@ -109,33 +275,33 @@ class JmsNodeManager:
         """
         # 1. 查询
         try:
-            resp = self.js_client._api_request(
-                "GET", f"/api/v1/assets/nodes/children/tree/?key={parent_key}")
-            for node in resp:
-                meta = node.get("meta", {}).get("data", {})
-                if meta.get("value") == value:
-                    self.logger.info(f"找到已存在节点: {value} (key: {meta.get('key')})")
-                    return {
-                        "id": meta.get("id"),
-                        "key_id": meta.get("key"),
-                        "value": value
-                    }
+            child = self._get_children(parent_key).get(value)
+            if child:
+                self.logger.info("找到已存在节点: %s (key: %s)", value, child["key_id"])
+                return dict(child)
         except Exception as e:
-            self.logger.warning(f"查询节点{value}失败: {e}")
+            self.logger.warning("查询节点%s失败: %s", value, e)
         
         # 2. 创建
         try:
             body = {"value": value}
-            self.logger.info(f"创建节点: {value} (父节点ID: {parent_id})")
+            self.logger.info("创建节点: %s (父节点ID: %s)", value, parent_id)
             resp = self.js_client._api_request(
                 "POST", f"/api/v1/assets/nodes/{parent_id}/children/", json_data=body)
-            return {
+            self.js_client._invalidate_node_index()
+            child = {
                 "id": resp.get("id"),
                 "key_id": resp.get("key"),
                 "value": value
             }
+            with self._lock:
+                cached = self._children_cache.get(parent_key)
+                if cached:
+                    cached[1][value] = child
+                self._created_children.setdefault(parent_key, {})[value] = (time.monotonic(), child)
+            return dict(child)
         except Exception as e:
-            self.logger.error(f"创建节点{value}失败: {e}")
+            self.logger.error("创建节点%s失败: %s", value, e)
             raise
 
     def get_nodes_map(self) -> Dict[str, Any]:
@@ -147,6 +313,67 @@ class JmsNodeManager:
         """
         return self.nodes_map
     
+    def _get_children(self, parent_key: str) -> Dict[str, Dict[str, Any]]:
+        """
+        获取父节点的直接子节点，结果在CHILDREN_CACHE_TTL秒内复用
+        
+        Args:
+            parent_key: 父节点key
+            
+        Returns:
+            Dict[str, Dict[str, Any]]: 子节点名称到节点信息的映射
+        """
+        with self._lock:
+            cached = self._children_cache.get(parent_key)
+        if cached and time.monotonic() - cached[0] < CHILDREN_CACHE_TTL:
+            return cached[1]
+        
+        # 请求在锁外发送，避免阻塞其他父节点的查询
+        started = time.monotonic()
+        resp = self.js_client._api_request(
+            "GET", f"/api/v1/assets/nodes/children/tree/?key={parent_key}")
+        children = {}
+        for node in resp:
+            meta = _node_meta(node)
+            value = meta.get("value")
+            if value is not None and value not in children:
+                children[value] = {
+                    "id": meta.get("id"),
+                    "key_id": meta.get("key"),
+                    "value": value
+                }
+        with self._lock:
+            # 请求期间其他线程新建的子节点可能不在响应中，合并后再替换缓存，避免丢失；
+            # 请求开始前创建的子节点已包含在响应中，不再保留
+            created = self._created_children.get(parent_key)
+            if created:
+                recent = {v: item for v, item in created.items() if item[0] >= started}
+                for value, (_, child) in recent.items():
+                    children.setdefault(value, child)
+                if recent:
+                    self._created_children[parent_key] = recent
+                else:
+                    del self._created_children[parent_key]
+            self._children_cache[parent_key] = (time.monotonic(), children)
+        return children
+
+    def _find_child(self, parent_key: str, value: str, full_value: str) -> Optional[Dict[str, Any]]:
+        """
+        在父节点的直接子节点中按名称查找节点
+        
+        Args:
+            parent_key: 父节点key
+            value: 子节点名称
+            full_value: 子节点完整路径
+            
+        Returns:
+            Optional[Dict[str, Any]]: 节点信息，如果未找到返回None
+        """
+        child = self._get_children(parent_key).get(value)
+        if not child:
+            return None
+        return {**child, "full_value": full_value}
+
     def get_node_by_path(self, path: str) -> Optional[Dict[str, Any]]:
         """
         通过路径获取节点信息
@@ -157,77 +384,45 @@ class JmsNodeManager:
         Returns:
             Optional[Dict[str, Any]]: 节点信息，如果未找到返回None
         """
-        # 1. 首先检查会话中是否有节点信息
-        path = path.rstrip('/')  # 移除末尾斜杠
-        if path in self.nodes_session:
-            self.logger.debug(f"从会话中获取节点信息: {path}")
-            return self.nodes_session[path]
+        # 1. 首先检查会话中是否有节点信息，命中时无需解析路径
+        node_info = self._session_node(path)
+        if node_info is None:
+            path = path.rstrip('/')  # 移除末尾斜杠
+            node_info = self._session_node(path)
+        if node_info is not None:
+            self.logger.debug("从会话中获取节点信息: %s", path)
+            return node_info
         
         # 2. 解析路径
         parts = path.strip('/').split('/')
         if not parts or parts[0] != "DEFAULT":
-            self.logger.error(f"无效的节点路径: {path}")
+            self.logger.error("无效的节点路径: %s", path)
             return None
         
-        # 3. 处理根节点
-        if len(parts) == 1:
-            root_node = self._get_root_node()
-            self.nodes_session[path] = root_node
-            return root_node
-        
-        # 4. 处理二级节点
-        if len(parts) == 2:
-            # 确保根节点存在
-            root_node = self._get_root_node()
-            if not root_node:
-                return None
-            
-            # 获取二级节点
-            try:
-                resp = self.js_client._api_request("GET", f"/api/v1/assets/nodes/children/tree/?key=1")
-                for node in resp:
-                    meta = node.get("meta", {}).get("data", {})
-                    if meta.get("value") == parts[1]:
-                        node_info = {
-                            "id": meta.get("id"),
-                            "key_id": meta.get("key"),
-                            "value": parts[1],
-                            "full_value": f"/DEFAULT/{parts[1]}"
-                        }
-                        self.nodes_session[path] = node_info
-                        return node_info
-            except Exception as e:
-                self.logger.error(f"获取二级节点失败: {e}")
+        if len(parts) > 3:
+            self.logger.error("不支持超过三级的节点路径: %s", path)
             return None
         
-        # 5. 处理三级节点
-        if len(parts) == 3:
-            # 先获取二级节点
-            second_node = self.get_node_by_path(f"/DEFAULT/{parts[1]}")
-            if not second_node:
-                return None
-            
-            # 获取三级节点
-            try:
-                resp = self.js_client._api_request(
-                    "GET", f"/api/v1/assets/nodes/children/tree/?key={second_node['key_id']}")
-                for node in resp:
-                    meta = node.get("meta", {}).get("data", {})
-                    if meta.get("value") == parts[2]:
-                        node_info = {
-                            "id": meta.get("id"),
-                            "key_id": meta.get("key"),
-                            "value": parts[2],
-                            "full_value": f"/DEFAULT/{parts[1]}/{parts[2]}"
-                        }
-                        self.nodes_session[path] = node_info
-                        return node_info
-            except Exception as e:
-                self.logger.error(f"获取三级节点失败: {e}")
-            return None
+        # 3. 自根节点向下逐级查找，已在会话中的层级直接复用
+        node = self.ROOT_NODE
+        current_path = "/DEFAULT"
+        for level, value in enumerate(parts[1:], start=2):
+            current_path = f"{current_path}/{value}"
+            child = self._session_node(current_path)
+            if not child:
+                try:
+                    child = self._find_child(node["key_id"], value, current_path)
+                except Exception as e:
+                    self.logger.error("获取%s级节点失败: %s", "二" if level == 2 else "三", e)
+                    return None
+                if not child:
+                    return None
+                self._store(current_path, child)
+            node = child
         
-        self.logger.error(f"不支持超过三级的节点路径: {path}")
-        return None 
+        if len(parts) == 1:
+            self._store(path, node)
+        return node
 
     def get_node_by_id(self, node_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -239,28 +434,30 @@ class JmsNodeManager:
         Returns:
             Optional[Dict[str, Any]]: 节点信息，如果未找到返回None
         """
+        # 检查会话中是否有该节点
+        node_info = self._nodes_by_id.get(node_id)
+        if node_info is not None:
+            return node_info
+        
+        # 只查询该节点本身，无需获取全部节点
         try:
-            # 检查会话中是否有该节点
-            for path, node in self.nodes_session.items():
-                if node.get("id") == node_id:
-                    return node
-                    
-            # 获取所有节点
-            nodes = self.js_client.get_nodes()
-            for node in nodes:
-                if node.id == node_id:
-                    node_info = {
-                        "id": node.id,
-                        "key_id": node.key,
-                        "value": node.value,
-                        "full_value": node.full_value
-                    }
-                    # 更新会话，如果有full_value
-                    if node.full_value:
-                        self.nodes_session[node.full_value] = node_info
-                    return node_info
+            node = self.js_client._api_request("GET", f"/api/v1/assets/nodes/{node_id}/")
+            if not isinstance(node, dict) or not node.get("id"):
+                return None
+            node_info = {
+                "id": node.get("id"),
+                "key_id": node.get("key"),
+                "value": node.get("value"),
+                "full_value": node.get("full_value")
+            }
+            # 更新会话，如果有full_value
+            if node_info["full_value"]:
+                self._store(node_info["full_value"], node_info)
+            else:
+                self._store_by_id(node_id, node_info)
+            return node_info
         except Exception as e:
-            self.logger.error(f"通过ID获取节点失败: {e}")
+            self.logger.error("通过ID获取节点失败: %s", e)
         return None
 
     def update_node(self, node_id: str, value: str) -> Optional[Dict[str, Any]]:
@@ -280,6 +477,10 @@ class JmsNodeManager:
             # 调用API
             response = self.js_client._api_request(
                 "PUT", f"/api/v1/assets/nodes/{node_id}/", json_data=update_data)
+            self.js_client._invalidate_node_index()
+            with self._lock:
+                self._children_cache.clear()
+                self._created_children.clear()
             # 返回更新后的节点信息
             node_info = {
                 "id": response.get("id"),
@@ -290,11 +491,12 @@ class JmsNodeManager:
             
             # 更新会话
             if response.get("full_value"):
-                self.nodes_session[response.get("full_value")] = node_info
+                self._store(response.get("full_value"), node_info)
+                self.save_cache()
                 
             return node_info
         except Exception as e:
-            self.logger.error(f"更新节点失败: {e}")
+            self.logger.error("更新节点失败: %s", e)
             return None
         
     def delete_node(self, node_id: str) -> bool:
@@ -308,20 +510,23 @@ class JmsNodeManager:
             bool: 删除是否成功
         """
         try:
-            # 获取节点信息，用于从会话中删除
-            node_info = self.get_node_by_id(node_id)
-            
             # 调用API删除节点
             self.js_client._api_request("DELETE", f"/api/v1/assets/nodes/{node_id}/")
-            
-            # 从会话中删除
-            if node_info and node_info.get("full_value"):
-                if node_info.get("full_value") in self.nodes_session:
-                    del self.nodes_session[node_info.get("full_value")]
+            self.js_client._invalidate_node_index()
+            with self._lock:
+                self._children_cache.clear()
+                self._created_children.clear()
+                # 从会话中删除，路径直接由ID索引得到，不在会话中的节点无需额外查询
+                path = self._path_by_id.get(node_id)
+                if path is not None:
+                    self._discard_unlocked(path)
+                self._nodes_by_id.pop(node_id, None)
+            if path is not None:
+                self.save_cache()
             
             return True
         except Exception as e:
-            self.logger.error(f"删除节点失败: {e}")
+            self.logger.error("删除节点失败: %s", e)
             return False
     
     def get_children_nodes(self, parent_key: str) -> List[Dict[str, Any]]:
@@ -342,7 +547,7 @@ class JmsNodeManager:
             # 处理结果
             children = []
             for node in resp:
-                meta = node.get("meta", {}).get("data", {})
+                meta = _node_meta(node)
                 child = {
                     "id": meta.get("id"),
                     "key_id": meta.get("key"),
@@ -353,11 +558,11 @@ class JmsNodeManager:
                 
                 # 更新会话
                 if child.get("full_value"):
-                    self.nodes_session[child.get("full_value")] = child
+                    self._store(child.get("full_value"), child)
             
             return children
         except Exception as e:
-            self.logger.error(f"获取子节点失败: {e}")
+            self.logger.error("获取子节点失败: %s", e)
             return []
     
     def get_or_create_nodes_by_path(self, path: str) -> Optional[Dict[str, Any]]:
@@ -370,65 +575,84 @@ class JmsNodeManager:
         Returns:
             Optional[Dict[str, Any]]: 节点信息，如果创建失败返回None
         """
-        # 1. 首先尝试直接获取
-        node = self.get_node_by_path(path)
+        # 1. 会话中已有时直接返回
+        path = path.rstrip('/')
+        node = self._session_node(path)
         if node:
             return node
         
         # 2. 解析路径
         parts = path.strip('/').split('/')
         if not parts or parts[0] != "DEFAULT":
-            self.logger.error(f"无效的节点路径: {path}")
+            self.logger.error("无效的节点路径: %s", path)
             return None
-        
-        # 3. 确保有根节点
-        root_node = self._get_root_node()
-        if not root_node:
-            self.logger.error("未找到根节点")
+        if len(parts) > 3:
+            self.logger.error("不支持超过三级的节点路径: %s", path)
             return None
         
-        # 4. 如果是根节点，直接返回
-        if len(parts) == 1:
-            return root_node
-        
-        # 5. 处理二级节点
-        if len(parts) >= 2:
-            # 获取或创建二级节点
-            second_node = self.get_node_by_path(f"/DEFAULT/{parts[1]}")
-            if not second_node:
-                # 创建二级节点
-                second_node = self._get_or_create_child_node(
-                    root_node["id"], root_node["key_id"], parts[1])
-                if second_node:
-                    # 更新会话
-                    second_node["full_value"] = f"/DEFAULT/{parts[1]}"
-                    self.nodes_session[f"/DEFAULT/{parts[1]}"] = second_node
-            
-            # 如果只需要二级节点，返回
-            if len(parts) == 2:
-                return second_node
-                
-            # 6. 处理三级节点
-            if len(parts) == 3:
-                # 获取或创建三级节点
-                third_node = self.get_node_by_path(f"/DEFAULT/{parts[1]}/{parts[2]}")
-                if not third_node:
-                    # 创建三级节点
-                    third_node = self._get_or_create_child_node(
-                        second_node["id"], second_node["key_id"], parts[2])
-                    if third_node:
-                        # 更新会话
-                        third_node["full_value"] = f"/DEFAULT/{parts[1]}/{parts[2]}"
-                        self.nodes_session[f"/DEFAULT/{parts[1]}/{parts[2]}"] = third_node
-                
-                return third_node
+        # 3. 自根节点向下逐级查找，每级只查询一次父节点的子节点，不存在时直接创建
+        node = self.ROOT_NODE
+        current_path = "/DEFAULT"
+        for value in parts[1:]:
+            current_path = f"{current_path}/{value}"
+            child = self._session_node(current_path)
+            if not child:
+                child = self._get_or_create_child_node(node["id"], node["key_id"], value)
+                if not child:
+                    return None
+                child["full_value"] = current_path
+                self._store(current_path, child)
+            node = child
+        
+        return node
+
+    def get_or_create_nodes_by_paths(self, paths: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        批量获取或创建节点，同一层级的节点并发处理
+        
+        先并发处理所有不同的二级节点，再并发处理所有三级节点，
+        总耗时取决于层级数而不是路径数。
+        
+        Args:
+            paths: 节点路径列表，格式如 "/DEFAULT/aliyun/prod"
             
-            # 7. 不支持超过三级的节点
-            if len(parts) > 3:
-                self.logger.error(f"不支持超过三级的节点路径: {path}")
-                return None
+        Returns:
+            Dict[str, Optional[Dict[str, Any]]]: 路径到节点信息的映射，创建失败的路径对应None
+        """
+        valid_parts = [
+            parts for parts in (path.strip('/').split('/') for path in paths)
+            if parts[0] == "DEFAULT" and len(parts) <= 3
+        ]
         
-        return None
+        for depth in (2, 3):
+            level_paths = list(dict.fromkeys(
+                "/" + "/".join(parts[:depth]) for parts in valid_parts if len(parts) >= depth
+            ))
+            pending = [path for path in level_paths
+                       if path not in self.nodes_session or path in self._unverified]
+            if not pending:
+                continue
+            workers = min(getattr(self.js_client, 'max_workers', 8), len(pending))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(self._safe_get_or_create, pending))
+        
+        return {path: self._safe_get_or_create(path) for path in paths}
+
+    def _safe_get_or_create(self, path: str) -> Optional[Dict[str, Any]]:
+        """
+        获取或创建节点，失败时记录日志并返回None，供并发调用使用
+        
+        Args:
+            path: 节点路径
+            
+        Returns:
+            Optional[Dict[str, Any]]: 节点信息，失败时返回None
+        """
+        try:
+            return self.get_or_create_nodes_by_path(path)
+        except Exception as e:
+            self.logger.error("获取或创建节点%s失败: %s", path, e)
+            return None
 
     def convert_to_node_info(self, node_data: Dict[str, Any]) -> NodeInfo:
         """
@@ -11,16 +11,24 @@
 """
 
 import logging
+import re
 import time
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Union, Tuple, Set, FrozenSet
 from datetime import datetime
 
 from jms_sync.jumpserver.models import AssetInfo
-from jms_sync.jumpserver.asset_manager import AssetManager
+from jms_sync.jumpserver.asset_manager import AssetManager, SYNC_COMMENT_PREFIX
 from jms_sync.jumpserver.node_manager import JmsNodeManager
 from jms_sync.jumpserver.client import JumpServerClient
 from jms_sync.utils.logger import get_logger
 
+# 备注中的实例ID行，格式为 "instance_id: i-xxxx"
+_INSTANCE_ID_RE = re.compile(r'instance_id:[^\S\n]*(\S+)')
+
+# 平台（小写）对应的默认协议和端口，未列出的平台按Linux处理
+_PLATFORM_SPEC = {'windows': ('rdp', 3389)}
+_DEFAULT_PLATFORM_SPEC = ('ssh', 22)
+
 class AssetSyncManager:
     """
     资产同步管理器，负责协调云平台资产与JumpServer资产的同步
@@ -92,9 +100,8 @@ class AssetSyncManager:
             "errors": []  # 用于记录错误信息
         }
         
-        # 初始化受保护的IP列表
-        if protected_ips is None:
-            protected_ips = []
+        # 初始化受保护的IP集合，删除阶段按IP逐个查询
+        protected_ips = frozenset(protected_ips or ())
             
         # 记录开始时间
         start_time = time.time()
@@ -104,313 +111,46 @@ class AssetSyncManager:
             js_assets = self.asset_manager.get_assets_by_node_id(node_id)
             self.logger.info(f"节点 {node_id} 下有 {len(js_assets)} 个JumpServer资产")
             
-            # 2. 构建JumpServer资产索引 - 按IP、名称和实例ID
+            # 2. 构建JumpServer资产索引 - 按IP和实例ID
             js_assets_by_ip = {}
-            js_assets_by_name = {}
             js_assets_by_instance_id = {}  # 添加按实例ID索引
+            js_instance_ids = {}  # 资产ID -> 实例ID，删除阶段复用，避免重复解析备注
+            extract_instance_id = self._extract_instance_id_from_comment
             for asset in js_assets:
-                if asset.address:
-                    js_assets_by_ip[asset.address] = asset
-                if asset.name:
-                    js_assets_by_name[asset.name] = asset
+                address = asset.address
+                if address:
+                    js_assets_by_ip[address] = asset
                 # 从备注中提取实例ID
-                instance_id = self._extract_instance_id_from_comment(asset.comment)
+                instance_id = extract_instance_id(asset.comment)
+                js_instance_ids[asset.id] = instance_id
                 if instance_id:
                     js_assets_by_instance_id[instance_id] = asset
             
             # 3. 构建云平台资产索引 - 按IP和实例ID
-            cloud_assets_by_ip = {}
-            cloud_assets_by_instance_id = {}  # 添加按实例ID索引
-            for asset in cloud_assets:
-                # 提取IP
-                ip = asset.get('ip') or asset.get('address') or asset.get('private_ip')
-                if ip:
-                    cloud_assets_by_ip[ip] = asset
-                
-                # 提取实例ID
-                instance_id = asset.get('instance_id')
-                if instance_id:
-                    cloud_assets_by_instance_id[instance_id] = asset
-                    
+            cloud_assets_by_ip, cloud_assets_by_instance_id, cloud_ips_by_instance_id = self._index_cloud(cloud_assets)
+            
             self.logger.info(f"云平台资产: {len(cloud_assets)}个 (按IP: {len(cloud_assets_by_ip)}个, 按实例ID: {len(cloud_assets_by_instance_id)}个)")
             self.logger.info(f"JumpServer资产: {len(js_assets)}个 (按IP: {len(js_assets_by_ip)}个, 按实例ID: {len(js_assets_by_instance_id)}个)")
             
             # 4. 处理需要创建和更新的资产 - 基于实例ID优先
-            processed_js_assets = set()  # 记录已处理的JMS资产ID，避免重复处理
+            to_create, to_update, processed_js_assets = self._process_cloud_assets(
+                cloud_assets_by_instance_id, cloud_ips_by_instance_id, js_assets_by_instance_id,
+                node_id, cloud_type, result
+            )
             
-            # 4.1 先基于实例ID处理
-            for instance_id, cloud_asset in cloud_assets_by_instance_id.items():
-                try:
-                    # 提取必要信息
-                    ip = cloud_asset.get('ip') or cloud_asset.get('address') or cloud_asset.get('private_ip')
-                    name = cloud_asset.get('hostname') or cloud_asset.get('instance_name', f"{cloud_type}-{ip}")
-                    platform = cloud_asset.get('os_type', 'Linux')
-                    
-                    # 构建备注信息
-                    comment_parts = [f"由JMS-Sync同步于 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"]
-                    for key in ["instance_id", "instance_type", "region", "vpc_id"]:
-                        if cloud_asset.get(key):
-                            comment_parts.append(f"{key}: {cloud_asset.get(key)}")
-                    comment = "\n".join(comment_parts)
-                    
-                    # 判断是否需要根据实例ID更新
-                    if instance_id in js_assets_by_instance_id:
-                        js_asset = js_assets_by_instance_id[instance_id]
-                        processed_js_assets.add(js_asset.id)  # 标记为已处理
-                        
-                        # 检查是否需要更新（比对关键属性）
-                        need_update = False
-                        update_reasons = []
-                        
-                        # 检查IP是否变化
-                        if js_asset.address != ip:
-                            need_update = True
-                            update_reasons.append(f"IP地址不同: {js_asset.address} -> {ip}")
-                            
-                        # 检查名称是否变化
-                        if js_asset.name != name:
-                            need_update = True
-                            update_reasons.append(f"名称不同: {js_asset.name} -> {name}")
-                            
-                        # 检查平台类型是否变化
-                        js_platform = "Windows" if js_asset.platform == 5 or getattr(js_asset, 'platform', '') == 'Windows' else "Linux"
-                        if js_platform.lower() != platform.lower():
-                            need_update = True
-                            update_reasons.append(f"平台类型不同: {js_platform} -> {platform}")
-                            
-                        # 检查协议和端口是否变化
-                        js_protocol = "rdp" if js_platform.lower() == "windows" else "ssh"
-                        js_port = 3389 if js_platform.lower() == "windows" else 22
-                        new_protocol = "rdp" if platform.lower() == "windows" else "ssh"
-                        new_port = 3389 if platform.lower() == "windows" else 22
-                        
-                        if js_protocol != new_protocol or getattr(js_asset, 'port', js_port) != new_port:
-                            need_update = True
-                            update_reasons.append(f"协议或端口变化: {js_protocol}:{getattr(js_asset, 'port', js_port)} -> {new_protocol}:{new_port}")
-                        
-                        if need_update:
-                            self.logger.info(f"更新资产: {js_asset.name} ({ip}), 实例ID: {instance_id}, 原因: {', '.join(update_reasons)}")
-                            
-                            # 确定平台ID
-                            platform_id = 1  # 默认为Linux
-                            if platform.lower() == 'windows':
-                                platform_id = 5
-                                
-                            # 确定协议和端口
-                            protocol = "ssh"
-                            port = 22
-                            if platform.lower() == 'windows':
-                                protocol = "rdp"
-                                port = 3389
-                            
-                            # 更新资产
-                            try:
-                                updated_asset = self.asset_manager.update_asset(
-                                    asset_id=js_asset.id,
-                                    name=name,
-                                    address=ip,
-                                    platform_id=platform_id,
-                                    node_id=node_id,
-                                    comment=comment,
-                                    protocol=protocol,
-                                    port=port
-                                )
-                                
-                                # 更新成功，记录更新信息
-                                self.updated_assets.append({
-                                    "name": name,
-                                    "ip": ip,
-                                    "platform": platform,
-                                    "instance_id": instance_id,
-                                    "update_reasons": update_reasons  # 记录更新原因
-                                })
-                                result["updated"] += 1
-                                self.update_reasons.append({
-                                    "asset": name,
-                                    "instance_id": instance_id,
-                                    "reasons": update_reasons
-                                })
-                            except Exception as e:
-                                self.logger.error(f"更新资产失败: {js_asset.name} ({ip}), 实例ID: {instance_id}, 错误: {str(e)}")
-                                result["failed"] += 1
-                                # 记录失败原因
-                                self.failed_operations.append({
-                                    "operation": "update",
-                                    "asset_name": name,
-                                    "asset_ip": ip,
-                                    "instance_id": instance_id,
-                                    "error": str(e)
-                                })
-                                result["errors"].append({
-                                    "asset_ip": ip,
-                                    "asset_name": name,
-                                    "instance_id": instance_id,
-                                    "operation": "update",
-                                    "message": str(e)
-                                })
-                        else:
-                            self.logger.debug(f"资产无需更新: {js_asset.name} ({ip}), 实例ID: {instance_id}")
-                            result["skipped"] += 1
-                    else:
-                        # 实例ID不存在，需要创建新资产
-                        self.logger.info(f"创建新资产: {name} ({ip}), 实例ID: {instance_id}")
-                        
-                        # 确定平台类型
-                        platform_id = 1  # 默认为Linux
-                        if platform.lower() == 'windows':
-                            platform_id = 5
-                            
-                        # 确定协议和端口
-                        protocol = "ssh"
-                        port = 22
-                        if platform.lower() == 'windows':
-                            protocol = "rdp"
-                            port = 3389
-                        
-                        # 创建资产
-                        try:
-                            if platform.lower() == 'windows':
-                                new_asset = self.asset_manager.create_windows_asset(
-                                    name=name,
-                                    address=ip,
-                                    node_id=node_id,
-                                    comment=comment,
-                                    port=port
-                                )
-                            else:
-                                new_asset = self.asset_manager.create_linux_asset(
-                                    name=name,
-                                    address=ip,
-                                    node_id=node_id,
-                                    comment=comment,
-                                    port=port
-                                )
-                                
-                            # 创建成功，记录创建信息
-                            self.created_assets.append({
-                                "name": name,
-                                "ip": ip,
-                                "platform": platform,
-                                "instance_id": instance_id
-                            })
-                            result["created"] += 1
-                        except Exception as e:
-                            self.logger.error(f"创建资产失败: {name} ({ip}), 实例ID: {instance_id}, 错误: {str(e)}")
-                            result["failed"] += 1
-                            # 记录失败原因
-                            self.failed_operations.append({
-                                "operation": "create",
-                                "asset_name": name,
-                                "asset_ip": ip,
-                                "instance_id": instance_id,
-                                "error": str(e)
-                            })
-                            result["errors"].append({
-                                "asset_ip": ip,
-                                "asset_name": name,
-                                "instance_id": instance_id,
-                                "operation": "create",
-                                "message": str(e)
-                            })
-                except Exception as e:
-                    self.logger.error(f"处理资产时发生错误: 实例ID: {instance_id}, 错误: {str(e)}")
-                    result["failed"] += 1
-                    # 记录失败原因
-                    result["errors"].append({
-                        "instance_id": instance_id,
-                        "operation": "process",
-                        "message": str(e)
-                    })
-                
             # 5. 处理需要删除的资产 - 根据instance_id和IP
+            to_delete = []
             if not no_delete:
-                # 获取所有云平台实例ID和IP
-                cloud_instance_ids = set(cloud_assets_by_instance_id.keys())
-                cloud_ips = set(cloud_assets_by_ip.keys())
-                
-                # 遍历JumpServer资产，检查哪些需要删除
-                for asset in js_assets:
-                    # 如果资产已经处理过，跳过
-                    if asset.id in processed_js_assets:
-                        continue
-                        
-                    # 从备注中提取实例ID
-                    instance_id = self._extract_instance_id_from_comment(asset.comment)
-                    
-                    # 检查资产是否应该删除
-                    should_delete = False
-                    delete_reason = ""
-                    
-                    # 优先检查实例ID
-                    if instance_id:
-                        if instance_id not in cloud_instance_ids:
-                            should_delete = True
-                            delete_reason = f"实例ID {instance_id} 在云平台不存在"
-                    # 如果没有实例ID，检查IP
-                    elif asset.address and asset.address not in cloud_ips:
-                        should_delete = True
-                        delete_reason = f"IP地址 {asset.address} 在云平台不存在"
-                    
-                    # 检查是否在受保护的IP列表中
-                    if asset.address in protected_ips:
-                        self.logger.info(f"跳过受保护资产: {asset.name} ({asset.address})")
-                        should_delete = False
-                        result["skipped"] += 1
-                        continue
-                    
-                    # 执行删除
-                    if should_delete:
-                        self.logger.info(f"删除资产: {asset.name} ({asset.address}), 原因: {delete_reason}")
-                        try:
-                            success = self.asset_manager.delete_asset(asset.id)
-                            if success:
-                                self.deleted_assets.append({
-                                    "name": asset.name,
-                                    "ip": asset.address,
-                                    "platform": asset.platform,
-                                    "instance_id": instance_id,
-                                    "reason": delete_reason
-                                })
-                                result["deleted"] += 1
-                            else:
-                                self.logger.warning(f"删除资产失败: {asset.name} ({asset.address})")
-                                result["failed"] += 1
-                                # 记录失败原因
-                                self.failed_operations.append({
-                                    "operation": "delete",
-                                    "asset_name": asset.name,
-                                    "asset_ip": asset.address,
-                                    "instance_id": instance_id,
-                                    "error": "删除操作返回失败"
-                                })
-                                result["errors"].append({
-                                    "asset_ip": asset.address,
-                                    "asset_name": asset.name,
-                                    "instance_id": instance_id,
-                                    "operation": "delete",
-                                    "message": "删除操作返回失败"
-                                })
-                        except Exception as e:
-                            self.logger.error(f"删除资产时发生错误: {asset.name} ({asset.address}), 错误: {str(e)}")
-                            result["failed"] += 1
-                            # 记录失败原因
-                            self.failed_operations.append({
-                                "operation": "delete",
-                                "asset_name": asset.name,
-                                "asset_ip": asset.address,
-                                "instance_id": instance_id,
-                                "error": str(e)
-                            })
-                            result["errors"].append({
-                                "asset_ip": asset.address,
-                                "asset_name": asset.name,
-                                "instance_id": instance_id,
-                                "operation": "delete",
-                                "message": str(e)
-                            })
+                to_delete = self._process_deletions(
+                    js_assets, js_instance_ids, processed_js_assets,
+                    cloud_assets_by_instance_id, cloud_assets_by_ip, protected_ips, result
+                )
             else:
                 self.logger.info("禁止删除JumpServer资产")
             
+            # 6. 在同一线程池中并发执行API调用
+            self._apply_changes(to_create, to_update, to_delete, result)
+            
         except Exception as e:
             self.logger.exception(f"同步资产时发生错误: {str(e)}")
             result["failed"] += 1
@@ -450,6 +190,309 @@ class AssetSyncManager:
         
         return result
     
+    def _process_cloud_assets(self, cloud_assets_by_instance_id: Dict[str, Dict],
+                              cloud_ips_by_instance_id: Dict[str, Optional[str]],
+                              js_assets_by_instance_id: Dict[str, AssetInfo], node_id: str,
+                              cloud_type: str, result: Dict[str, Any]) -> Tuple[List[tuple], List[tuple], Set[str]]:
+        """
+        比对云平台资产与JumpServer资产，决定需要创建和更新的资产
+        
+        只做决策不调用API，待处理的操作由_apply_changes统一执行。
+        
+        Args:
+            cloud_assets_by_instance_id: 按实例ID索引的云平台资产
+            cloud_ips_by_instance_id: 实例ID到IP的映射
+            js_assets_by_instance_id: 按实例ID索引的JumpServer资产
+            node_id: JumpServer节点ID
+            cloud_type: 云平台类型
+            result: 同步结果统计
+            
+        Returns:
+            Tuple[List[tuple], List[tuple], Set[str]]: 待创建列表、待更新列表和已处理的JumpServer资产ID
+        """
+        processed_js_assets = set()  # 记录已处理的JMS资产ID，避免重复处理
+        to_create = []  # (AssetInfo, 记录信息)
+        to_update = []  # (AssetInfo, 记录信息, 更新原因)
+        skipped = 0  # 局部计数，结束时写回result
+        
+        # 同步时间对本次同步的所有资产相同，只需格式化一次
+        sync_header = f"{SYNC_COMMENT_PREFIX} {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        
+        # 基于实例ID处理
+        for instance_id, cloud_asset in cloud_assets_by_instance_id.items():
+            try:
+                # 提取必要信息
+                ip = cloud_ips_by_instance_id[instance_id]
+                name = cloud_asset.get('hostname') or cloud_asset.get('instance_name', f"{cloud_type}-{ip}")
+                platform = cloud_asset.get('os_type', 'Linux')
+                
+                # 确定协议和端口
+                platform_key = platform.lower()
+                protocol, port = _PLATFORM_SPEC.get(platform_key, _DEFAULT_PLATFORM_SPEC)
+                
+                js_asset = js_assets_by_instance_id.get(instance_id)
+                if js_asset is not None:
+                    processed_js_assets.add(js_asset.id)  # 标记为已处理
+                    js_platform_key = "windows" if js_asset.platform == 5 or js_asset.platform == 'Windows' else "linux"
+                    
+                    # 快速路径：关键属性一次比较，未变化时不再构建备注和更新原因
+                    if (js_asset.address, js_asset.name, js_platform_key, js_asset.port) == (ip, name, platform_key, port):
+                        self.logger.debug("资产无需更新: %s (%s), 实例ID: %s", js_asset.name, ip, instance_id)
+                        skipped += 1
+                        continue
+                
+                # 构建备注信息
+                comment_parts = [sync_header]
+                for key in ["instance_id", "instance_type", "region", "vpc_id"]:
+                    if cloud_asset.get(key):
+                        comment_parts.append(f"{key}: {cloud_asset.get(key)}")
+                comment = "\n".join(comment_parts)
+                
+                record = {
+                    "name": name,
+                    "ip": ip,
+                    "platform": platform,
+                    "instance_id": instance_id
+                }
+                
+                # 实例ID已存在，逐项比对生成更新原因
+                if js_asset is not None:
+                    update_reasons = []
+                    
+                    # 检查IP是否变化
+                    if js_asset.address != ip:
+                        update_reasons.append(f"IP地址不同: {js_asset.address} -> {ip}")
+                    
+                    # 检查名称是否变化
+                    if js_asset.name != name:
+                        update_reasons.append(f"名称不同: {js_asset.name} -> {name}")
+                    
+                    # 检查平台类型是否变化
+                    if js_platform_key != platform_key:
+                        update_reasons.append(f"平台类型不同: {js_platform_key.capitalize()} -> {platform}")
+                    
+                    # 检查协议和端口是否变化
+                    js_protocol = _PLATFORM_SPEC.get(js_platform_key, _DEFAULT_PLATFORM_SPEC)[0]
+                    if js_protocol != protocol or js_asset.port != port:
+                        update_reasons.append(f"协议或端口变化: {js_protocol}:{js_asset.port} -> {protocol}:{port}")
+                    
+                    self.logger.info("更新资产: %s (%s), 实例ID: %s, 原因: %s", js_asset.name, ip, instance_id, ', '.join(update_reasons))
+                    to_update.append((AssetInfo(
+                        id=js_asset.id,
+                        name=name,
+                        address=ip,
+                        platform=platform,
+                        protocol=protocol,
+                        port=port,
+                        node_id=node_id,
+                        comment=comment
+                    ), record, update_reasons))
+                else:
+                    # 实例ID不存在，需要创建新资产
+                    self.logger.info("创建新资产: %s (%s), 实例ID: %s", name, ip, instance_id)
+                    to_create.append((AssetInfo(
+                        name=name,
+                        address=ip,
+                        platform=platform,
+                        protocol=protocol,
+                        port=port,
+                        node_id=node_id,
+                        comment=comment
+                    ), record))
+            except Exception as e:
+                self.logger.error("处理资产时发生错误: 实例ID: %s, 错误: %s", instance_id, e)
+                result["failed"] += 1
+                # 记录失败原因
+                result["errors"].append({
+                    "instance_id": instance_id,
+                    "operation": "process",
+                    "message": str(e)
+                })
+        
+        result["skipped"] += skipped
+        return to_create, to_update, processed_js_assets
+    
+    def _process_deletions(self, js_assets: List[AssetInfo], js_instance_ids: Dict[str, Optional[str]],
+                           processed_js_assets: Set[str], cloud_assets_by_instance_id: Dict[str, Dict],
+                           cloud_assets_by_ip: Dict[str, Dict], protected_ips: FrozenSet[str],
+                           result: Dict[str, Any]) -> List[tuple]:
+        """
+        找出云平台中已不存在的JumpServer资产
+        
+        Args:
+            js_assets: 节点下的JumpServer资产
+            js_instance_ids: 资产ID到实例ID的映射
+            processed_js_assets: 已在创建/更新阶段处理过的资产ID
+            cloud_assets_by_instance_id: 按实例ID索引的云平台资产
+            cloud_assets_by_ip: 按IP索引的云平台资产
+            protected_ips: 受保护的IP集合
+            result: 同步结果统计
+            
+        Returns:
+            List[tuple]: 待删除列表，元素为(AssetInfo, 实例ID, 删除原因)
+        """
+        to_delete = []
+        skipped = 0  # 局部计数，结束时写回result
+        
+        # 遍历JumpServer资产，检查哪些需要删除
+        for asset in js_assets:
+            # 如果资产已经处理过，跳过
+            if asset.id in processed_js_assets:
+                continue
+            
+            # 从备注中提取的实例ID
+            instance_id = js_instance_ids[asset.id]
+            
+            # 检查资产是否应该删除
+            should_delete = False
+            delete_reason = ""
+            
+            # 优先检查实例ID
+            if instance_id:
+                if instance_id not in cloud_assets_by_instance_id:
+                    should_delete = True
+                    delete_reason = f"实例ID {instance_id} 在云平台不存在"
+            # 如果没有实例ID，检查IP
+            elif asset.address and asset.address not in cloud_assets_by_ip:
+                should_delete = True
+                delete_reason = f"IP地址 {asset.address} 在云平台不存在"
+            
+            # 检查是否在受保护的IP列表中
+            if asset.address in protected_ips:
+                self.logger.info("跳过受保护资产: %s (%s)", asset.name, asset.address)
+                should_delete = False
+                skipped += 1
+                continue
+            
+            if should_delete:
+                self.logger.info("删除资产: %s (%s), 原因: %s", asset.name, asset.address, delete_reason)
+                to_delete.append((asset, instance_id, delete_reason))
+        
+        result["skipped"] += skipped
+        return to_delete
+    
+    def _apply_changes(self, to_create: List[tuple], to_update: List[tuple], to_delete: List[tuple],
+                       result: Dict[str, Any]) -> None:
+        """
+        并发执行待处理的创建、更新和删除操作并记录结果
+        
+        结果按下标与待处理列表一一对应。
+        
+        Args:
+            to_create: 待创建列表
+            to_update: 待更新列表
+            to_delete: 待删除列表
+            result: 同步结果统计
+        """
+        created, updated, deleted = self.asset_manager.bulk_apply(
+            [item[0] for item in to_create],
+            [item[0] for item in to_update],
+            [item[0].id for item in to_delete]
+        )
+        
+        # 成功记录先收集到局部列表，最后一次性追加到同步状态
+        created_records = []
+        updated_records = []
+        reason_records = []
+        deleted_records = []
+        
+        for (asset_info, record), outcome in zip(to_create, created):
+            if isinstance(outcome, Exception):
+                self.logger.error("创建资产失败: %s (%s), 实例ID: %s, 错误: %s",
+                                  record['name'], record['ip'], record['instance_id'], outcome)
+                self._record_failure(result, "create", record['name'], record['ip'], record['instance_id'], str(outcome))
+                continue
+            created_records.append(record)
+        
+        for (asset_info, record, update_reasons), outcome in zip(to_update, updated):
+            if isinstance(outcome, Exception):
+                self.logger.error("更新资产失败: %s (%s), 实例ID: %s, 错误: %s",
+                                  record['name'], record['ip'], record['instance_id'], outcome)
+                self._record_failure(result, "update", record['name'], record['ip'], record['instance_id'], str(outcome))
+                continue
+            updated_records.append(dict(record, update_reasons=update_reasons))  # 记录更新原因
+            reason_records.append({
+                "asset": record['name'],
+                "instance_id": record['instance_id'],
+                "reasons": update_reasons
+            })
+        
+        for (asset, instance_id, delete_reason), outcome in zip(to_delete, deleted):
+            if isinstance(outcome, Exception):
+                self.logger.error("删除资产时发生错误: %s (%s), 错误: %s", asset.name, asset.address, outcome)
+                self._record_failure(result, "delete", asset.name, asset.address, instance_id, str(outcome))
+            elif not outcome:
+                self.logger.warning("删除资产失败: %s (%s)", asset.name, asset.address)
+                self._record_failure(result, "delete", asset.name, asset.address, instance_id, "删除操作返回失败")
+            else:
+                deleted_records.append({
+                    "name": asset.name,
+                    "ip": asset.address,
+                    "platform": asset.platform,
+                    "instance_id": instance_id,
+                    "reason": delete_reason
+                })
+        
+        self.created_assets.extend(created_records)
+        self.updated_assets.extend(updated_records)
+        self.update_reasons.extend(reason_records)
+        self.deleted_assets.extend(deleted_records)
+        result["created"] += len(created_records)
+        result["updated"] += len(updated_records)
+        result["deleted"] += len(deleted_records)
+    
+    @staticmethod
+    def _index_cloud(cloud_assets: List[Dict]) -> Tuple[Dict[str, Dict], Dict[str, Dict], Dict[str, Optional[str]]]:
+        """
+        一次遍历构建云平台资产索引
+        
+        Args:
+            cloud_assets: 云平台资产列表
+            
+        Returns:
+            Tuple[Dict[str, Dict], Dict[str, Dict], Dict[str, Optional[str]]]:
+                按IP索引的资产、按实例ID索引的资产、实例ID到IP的映射
+        """
+        ips = []
+        instance_ids = []
+        for asset in cloud_assets:
+            ips.append(asset.get('ip') or asset.get('address') or asset.get('private_ip'))
+            instance_ids.append(asset.get('instance_id'))
+        
+        by_ip = {ip: asset for ip, asset in zip(ips, cloud_assets) if ip}
+        by_instance_id = {iid: asset for iid, asset in zip(instance_ids, cloud_assets) if iid}
+        ip_by_instance_id = {iid: ip for iid, ip in zip(instance_ids, ips) if iid}
+        return by_ip, by_instance_id, ip_by_instance_id
+    
+    def _record_failure(self, result: Dict[str, Any], operation: str, name: str, ip: str,
+                        instance_id: Optional[str], message: str) -> None:
+        """
+        记录失败的资产操作
+        
+        Args:
+            result: 同步结果统计
+            operation: 操作类型，create、update或delete
+            name: 资产名称
+            ip: 资产IP
+            instance_id: 实例ID
+            message: 错误信息
+        """
+        result["failed"] += 1
+        self.failed_operations.append({
+            "operation": operation,
+            "asset_name": name,
+            "asset_ip": ip,
+            "instance_id": instance_id,
+            "error": message
+        })
+        result["errors"].append({
+            "asset_ip": ip,
+            "asset_name": name,
+            "instance_id": instance_id,
+            "operation": operation,
+            "message": message
+        })
+    
     def _extract_instance_id_from_comment(self, comment: str) -> Optional[str]:
         """
         从资产备注中提取实例ID
@@ -463,17 +506,8 @@ class AssetSyncManager:
         if not comment:
             return None
             
-        # 检查常见的实例ID格式
-        if "instance_id:" in comment:
-            # 找到实例ID行并提取
-            lines = comment.split("\n")
-            for line in lines:
-                if "instance_id:" in line:
-                    parts = line.split("instance_id:", 1)
-                    if len(parts) > 1:
-                        return parts[1].strip()
-        
-        return None
+        match = _INSTANCE_ID_RE.search(comment)
+        return match.group(1) if match else None
     
     def get_sync_status(self) -> Dict[str, List[AssetInfo]]:
         """
@@ -677,11 +677,12 @@ class SyncManager:
                 
             # 提取实例名称
             instance_name = self._extract_instance_name(instance)
+            
+            # 提取操作系统类型，复用已提取的实例名称
+            os_type = self._extract_os_type(instance, instance_name)
+            
             if not instance_name:
                 instance_name = f"{cloud_type}-{instance_id}"
-                
-            # 提取操作系统类型
-            os_type = self._extract_os_type(instance)
             
             # 构建资产数据
             asset_data = {
@@ -801,12 +802,13 @@ class SyncManager:
         # 无法获取实例名称
         return ""
         
-    def _extract_os_type(self, instance: Dict[str, Any]) -> str:
+    def _extract_os_type(self, instance: Dict[str, Any], instance_name: Optional[str] = None) -> str:
         """
         提取操作系统类型
         
         Args:
             instance: 实例数据
+            instance_name: 已提取的实例名称，为None时从实例数据中提取
             
         Returns:
             str: 操作系统类型 ('Linux' 或 'Windows')
@@ -832,9 +834,10 @@ class SyncManager:
             if isinstance(os_name, str) and 'windows' in os_name.lower():
                 return 'Windows'
                 
-        # 尝试从实例名称判断操作系统类型
-        instance_name = self._extract_instance_name(instance)
-        if instance_name and ('windows' in instance_name.lower() or 'win' in instance_name.lower()):
+        # 尝试从实例名称判断操作系统类型（包含"win"即涵盖"windows"）
+        if instance_name is None:
+            instance_name = self._extract_instance_name(instance)
+        if instance_name and 'win' in instance_name.lower():
             return 'Windows'
             
         # 使用默认操作系统类型
@@ -6,18 +6,28 @@
 """
 
 import time
+import random
 import functools
 import hashlib
 import json
 import logging
 import inspect
+import threading
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Callable, Dict, Tuple, Any, Type, Optional, List, Union, Set
 
+try:
+    import orjson
+except ImportError:  # orjson未安装时退回标准库json
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
-# 缓存存储
-_CACHE: Dict[str, Tuple[Any, datetime]] = {}
+# 缓存存储，按最近使用顺序排列，超过上限时淘汰最久未使用的条目
+_CACHE: "OrderedDict[str, Tuple[Any, datetime]]" = OrderedDict()
+_CACHE_MAX_SIZE = 4096
+_CACHE_LOCK = threading.Lock()  # 保护_CACHE，所有读写都需持有此锁
 
 
 def deprecated(reason: str):
@@ -39,6 +49,25 @@ def deprecated(reason: str):
     return decorator
 
 
+def _dumps_sorted(obj: Any) -> str:
+    """
+    按键排序序列化对象，用于生成缓存键。
+
+    Args:
+        obj: 待序列化对象
+
+    Returns:
+        str: 序列化结果，无法序列化时使用字符串表示
+    """
+    try:
+        if orjson is not None:
+            return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS).decode()
+        return json.dumps(obj, sort_keys=True)
+    except (TypeError, ValueError):
+        # 如果参数无法序列化，使用字符串表示
+        return str(obj)
+
+
 def _generate_cache_key(func: Callable, args: Tuple, kwargs: Dict) -> str:
     """
     生成缓存键。
@@ -55,27 +84,37 @@ def _generate_cache_key(func: Callable, args: Tuple, kwargs: Dict) -> str:
     func_name = f"{func.__module__}.{func.__qualname__}"
     
     # 序列化参数
-    try:
-        args_str = json.dumps(args, sort_keys=True)
-    except (TypeError, ValueError):
-        # 如果参数无法序列化，使用字符串表示
-        args_str = str(args)
+    args_str = _dumps_sorted(args)
+    kwargs_str = _dumps_sorted(kwargs)
     
-    try:
-        kwargs_str = json.dumps(kwargs, sort_keys=True)
-    except (TypeError, ValueError):
-        # 如果参数无法序列化，使用字符串表示
-        kwargs_str = str(kwargs)
-    
-    # 组合并计算哈希
-    key_data = f"{func_name}:{args_str}:{kwargs_str}"
-    return hashlib.md5(key_data.encode()).hexdigest()
+    # 组合并计算哈希，保留函数名前缀以便按函数清除缓存
+    key_data = f"{args_str}:{kwargs_str}"
+    return f"{func_name}:{hashlib.md5(key_data.encode()).hexdigest()}"
+
+
+def _cache_set(key: str, value: Any, ttl: int) -> None:
+    """
+    写入缓存，超过容量上限时淘汰最久未使用的条目。
+
+    Args:
+        key: 缓存键
+        value: 缓存值
+        ttl: 缓存生存时间（秒）
+    """
+    entry = (value, datetime.now() + timedelta(seconds=ttl))
+    with _CACHE_LOCK:
+        _CACHE[key] = entry
+        _CACHE.move_to_end(key)
+        while len(_CACHE) > _CACHE_MAX_SIZE:
+            _CACHE.popitem(last=False)
 
 
 def cache_result(ttl: int = 300, cache_none: bool = False, cache_errors: bool = False):
     """
     缓存函数结果的装饰器。
 
+    所有被装饰函数共享同一个缓存，最多保存_CACHE_MAX_SIZE个条目，可在多线程中使用。
+
     Args:
         ttl: 缓存生存时间（秒）
         cache_none: 是否缓存None结果
@@ -94,12 +133,14 @@ def cache_result(ttl: int = 300, cache_none: bool = False, cache_errors: bool =
             cache_key = _generate_cache_key(func, args, kwargs)
             
             # 检查缓存
-            if cache_key in _CACHE:
-                result, expiry = _CACHE[cache_key]
-                if datetime.now() < expiry:
-                    return result
-                # 缓存已过期，删除
-                del _CACHE[cache_key]
+            with _CACHE_LOCK:
+                entry = _CACHE.get(cache_key)
+                if entry is not None:
+                    if datetime.now() < entry[1]:
+                        _CACHE.move_to_end(cache_key)
+                        return entry[0]
+                    # 缓存已过期，删除
+                    del _CACHE[cache_key]
             
             # 执行函数
             try:
@@ -107,22 +148,23 @@ def cache_result(ttl: int = 300, cache_none: bool = False, cache_errors: bool =
                 
                 # 缓存结果（如果不是None或者允许缓存None）
                 if result is not None or cache_none:
-                    _CACHE[cache_key] = (result, datetime.now() + timedelta(seconds=ttl))
+                    _cache_set(cache_key, result, ttl)
                 
                 return result
             except Exception as e:
                 if cache_errors:
                     # 缓存异常结果
-                    _CACHE[cache_key] = (e, datetime.now() + timedelta(seconds=ttl))
+                    _cache_set(cache_key, e, ttl)
                 raise
         
         # 添加清除缓存的方法
         def clear_cache():
             """清除此函数的所有缓存"""
-            func_name = f"{func.__module__}.{func.__qualname__}"
-            keys_to_delete = [k for k in _CACHE.keys() if k.startswith(func_name)]
-            for key in keys_to_delete:
-                del _CACHE[key]
+            prefix = f"{func.__module__}.{func.__qualname__}:"
+            with _CACHE_LOCK:
+                keys_to_delete = [k for k in _CACHE if k.startswith(prefix)]
+                for key in keys_to_delete:
+                    del _CACHE[key]
         
         wrapper.clear_cache = clear_cache
         return wrapper
@@ -135,10 +177,15 @@ def retry(
     retry_interval: int = 2, 
     backoff_factor: float = 1.5,
     exceptions: Tuple[Type[Exception], ...] = (Exception,),
-    retry_on_result: Optional[Callable[[Any], bool]] = None
+    retry_on_result: Optional[Callable[[Any], bool]] = None,
+    max_interval: Optional[float] = None,
+    jitter: float = 0.0
 ):
     """
     重试装饰器，在函数执行失败时自动重试。
+    
+    如果异常带有retry_after属性（如服务端返回的Retry-After），则按该值等待，
+    同样不超过max_interval。
 
     Args:
         max_retries: 最大重试次数
@@ -146,6 +193,8 @@ def retry(
         backoff_factor: 重试间隔的增长因子
         exceptions: 需要重试的异常类型
         retry_on_result: 根据结果决定是否重试的函数
+        max_interval: 重试间隔上限（秒），None表示不限制
+        jitter: 随机抖动比例，实际间隔为 间隔 * (1 + random() * jitter)
 
     Returns:
         Callable: 装饰器函数
@@ -155,6 +204,13 @@ def retry(
         
         logger = logging.getLogger(func.__module__)
         
+        def compute_delay(interval: float) -> float:
+            """计算本次等待时间"""
+            delay = min(interval, max_interval) if max_interval else interval
+            if jitter:
+                delay *= 1 + random.random() * jitter
+            return delay
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> Any:
             """包装函数"""
@@ -172,8 +228,9 @@ def retry(
                             return result
                         
                         retry_count += 1
-                        logger.warning(f"函数 {func.__name__} 返回需要重试的结果，将在{current_interval}秒后重试({retry_count}/{max_retries})")
-                        time.sleep(current_interval)
+                        delay = compute_delay(current_interval)
+                        logger.warning(f"函数 {func.__name__} 返回需要重试的结果，将在{delay:.2f}秒后重试({retry_count}/{max_retries})")
+                        time.sleep(delay)
                         current_interval *= backoff_factor
                         continue
                     
@@ -184,8 +241,14 @@ def retry(
                         raise
                     
                     retry_count += 1
-                    logger.warning(f"函数 {func.__name__} 执行失败，将在{current_interval}秒后重试({retry_count}/{max_retries}): {str(e)}")
-                    time.sleep(current_interval)
+                    retry_after = getattr(e, 'retry_after', None)
+                    if retry_after is not None:
+                        # 服务端给出的等待时间同样受max_interval限制，过去的时间按0处理
+                        delay = max(0, min(retry_after, max_interval) if max_interval else retry_after)
+                    else:
+                        delay = compute_delay(current_interval)
+                    logger.warning(f"函数 {func.__name__} 执行失败，将在{delay:.2f}秒后重试({retry_count}/{max_retries}): {str(e)}")
+                    time.sleep(delay)
                     current_interval *= backoff_factor
         
         return wrapper
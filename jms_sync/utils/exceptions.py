@@ -117,6 +117,22 @@ class JumpServerAPIError(JumpServerError):
     pass
 
 
+class JumpServerRateLimitError(JumpServerAPIError):
+    """JumpServer限流或暂时不可用(429/503)"""
+    
+    def __init__(self, message: str = "", retry_after: Optional[float] = None, **kwargs):
+        """
+        初始化限流异常
+        
+        Args:
+            message: 异常消息
+            retry_after: 服务端通过Retry-After要求等待的秒数
+            **kwargs: 传递给APIError的其他参数
+        """
+        super().__init__(message, **kwargs)
+        self.retry_after = retry_after
+
+
 class JumpServerResourceNotFound(JumpServerError):
     """JumpServer资源不存在"""
     pass